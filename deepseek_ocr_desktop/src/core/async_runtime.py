@@ -0,0 +1,63 @@
+"""
+Async Runtime
+Single process-wide asyncio event loop running on a daemon thread.
+Worker threads submit coroutines (e.g. VLLMClient.ainfer) to it, so all
+in-flight vLLM requests share one loop and one connection pool.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, Optional
+
+from utils.logger import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared event loop, starting its thread on first use
+
+    Returns:
+        Running event loop owned by the runtime thread
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="dsocr_async_runtime", daemon=True
+            ).start()
+            _loop = loop
+            logger.debug("Async runtime event loop started")
+    return _loop
+
+
+def submit(coro: Coroutine) -> concurrent.futures.Future:
+    """Schedule a coroutine on the shared event loop
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Future for the coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+
+def run(coro: Coroutine) -> Any:
+    """Run a coroutine on the shared event loop and wait for its result
+
+    Must not be called from the runtime thread itself.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    return submit(coro).result()
@@ -4,8 +4,23 @@ Parses grounding boxes from model output and scales coordinates
 Extracted from backend/main.py (lines 167-244)
 """
 
+import ast
+import json
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set
+
+import numpy as np
+
+try:
+    # Optional: compiles the box scaling loop to native code
+    from numba import njit
+except ImportError:
+    njit = None
+
+from utils.logger import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
 
 
 # Match a full detection block and capture the coordinates as the entire list expression
@@ -19,6 +34,100 @@ DET_BLOCK = re.compile(
     re.DOTALL,
 )
 
+# Single alternation used by clean_grounding_text: a full ref/det block (group 1 holds
+# the label) or a standalone <|grounding|> tag, so both are stripped in one scan
+_GROUNDING_RE = re.compile(
+    r"<\|grounding\|>|<\|ref\|>(.*?)<\|/ref\|>\s*<\|det\|>\s*\[.*\]\s*<\|/det\|>",
+    re.DOTALL,
+)
+
+# Opening grounding tags; one scan tells callers which post-processing steps apply
+_TAG_RE = re.compile(r"<\|(det|ref|grounding)\|>")
+_ALL_TAGS = frozenset(("det", "ref", "grounding"))
+
+# Fast path for the usual coords shape: one flat integer box or a list of integer boxes
+_INT_BOXES_RE = re.compile(
+    r"\[(?:\s*\d+\s*,){3}\s*\d+\s*\]"
+    r"|\[\s*\[(?:\s*\d+\s*,){3}\s*\d+\s*\](?:\s*,\s*\[(?:\s*\d+\s*,){3}\s*\d+\s*\])*\s*\]"
+)
+_INT_RE = re.compile(r"\d+")
+
+
+def _scale_boxes_numpy(arr: np.ndarray, image_width: int, image_height: int) -> np.ndarray:
+    """Scale (N, 4) boxes from 0-999 normalized coords to pixels with NumPy
+
+    Uses the same operation order as the scalar int(x / 999 * w) so results match exactly.
+    """
+    dims = np.array([image_width, image_height, image_width, image_height], dtype=np.float64)
+    return (arr / 999 * dims).astype(np.int64)
+
+
+def _scale_boxes_kernel(arr, image_width, image_height):
+    """Scale (N, 4) boxes from 0-999 normalized coords to pixels (Numba version)"""
+    out = np.empty((arr.shape[0], 4), np.int64)
+    for i in range(arr.shape[0]):
+        out[i, 0] = int(arr[i, 0] / 999.0 * image_width)
+        out[i, 1] = int(arr[i, 1] / 999.0 * image_height)
+        out[i, 2] = int(arr[i, 2] / 999.0 * image_width)
+        out[i, 3] = int(arr[i, 3] / 999.0 * image_height)
+    return out
+
+
+def _jit_scale_boxes():
+    """Compile-wrap the scaling kernel with Numba, or return None if unavailable
+
+    The on-disk cache needs a writable location next to the source, which
+    frozen or read-only installs lack; retry without it before giving up.
+    """
+    if njit is None:
+        return None
+    for options in ({"cache": True}, {}):
+        try:
+            return njit(**options)(_scale_boxes_kernel)
+        except Exception as e:
+            logger.debug("Numba setup failed (%s): %s", options, e)
+    return None
+
+
+_scale_boxes_jit = _jit_scale_boxes()
+
+
+def _scale_boxes(arr: np.ndarray, image_width: float, image_height: float) -> np.ndarray:
+    """Scale (N, 4) boxes with the Numba kernel, falling back to NumPy
+
+    A compile error on first call disables the kernel for the rest of the process.
+    """
+    global _scale_boxes_jit
+    if _scale_boxes_jit is not None:
+        try:
+            return _scale_boxes_jit(arr, image_width, image_height)
+        except Exception as e:
+            logger.warning("Numba box scaling failed, using NumPy instead: %s", e)
+            _scale_boxes_jit = None
+    return _scale_boxes_numpy(arr, image_width, image_height)
+
+
+def _grounding_replacement(m: "re.Match[str]") -> str:
+    """Keep the label of a ref/det block; drop standalone grounding tags"""
+    return m.group(1) or ""
+
+
+def find_grounding_tags(text: str) -> Set[str]:
+    """Find which grounding tags occur in model output, in a single scan
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        Subset of {"det", "ref", "grounding"}
+    """
+    tags = set()
+    for match in _TAG_RE.finditer(text):
+        tags.add(match.group(1))
+        if len(tags) == len(_ALL_TAGS):
+            break
+    return tags
+
 
 def clean_grounding_text(text: str) -> str:
     """Remove grounding tags from text for display, keeping labels
@@ -29,18 +138,61 @@ def clean_grounding_text(text: str) -> str:
     Returns:
         Cleaned text with tags removed
     """
+    # Fast path: plain OCR output carries no grounding tags, skip the regex scan
+    if "<|ref|>" not in text and "<|grounding|>" not in text:
+        return text.strip()
+
     # Replace <|ref|>label<|/ref|><|det|>[...any nested lists...]<|/det|> with just the label
-    cleaned = re.sub(
-        r"<\|ref\|>(.*?)<\|/ref\|>\s*<\|det\|>\s*\[.*\]\s*<\|/det\|>",
-        r"\1",
-        text,
-        flags=re.DOTALL,
-    )
-    # Also remove any standalone grounding tags
-    cleaned = re.sub(r"<\|grounding\|>", "", cleaned)
+    # and remove any standalone grounding tags in the same pass
+    cleaned = _GROUNDING_RE.sub(_grounding_replacement, text)
     return cleaned.strip()
 
 
+def _parse_box_list(coords_str: str) -> List[Any]:
+    """Parse a general coords expression into [x1, y1, x2, y2] boxes
+
+    Args:
+        coords_str: Bracketed list captured from a detection block
+
+    Returns:
+        List of well-formed boxes (malformed entries are skipped)
+
+    Raises:
+        ValueError/SyntaxError: If the expression cannot be parsed
+    """
+    # Parse the full bracket expression directly (handles single and multiple)
+    # The model emits JSON-compatible lists; fall back to literal_eval for
+    # the rare non-JSON output (e.g. trailing comma)
+    try:
+        parsed = json.loads(coords_str)
+    except ValueError:
+        parsed = ast.literal_eval(coords_str)
+
+    # Normalize to a list of lists
+    if (
+        isinstance(parsed, list)
+        and len(parsed) == 4
+        and all(isinstance(n, (int, float)) for n in parsed)
+    ):
+        # Single box provided as [x1,y1,x2,y2]
+        box_coords = [parsed]
+        logger.debug("Single box (flat list) detected")
+    elif isinstance(parsed, list):
+        box_coords = parsed
+        logger.debug("Boxes detected: %d", len(box_coords))
+    else:
+        raise ValueError("Unsupported coords structure")
+
+    # Keep only well-formed boxes, truncated to [x1, y1, x2, y2]
+    valid_boxes = []
+    for box in box_coords:
+        if isinstance(box, (list, tuple)) and len(box) >= 4:
+            valid_boxes.append(box[:4])
+        else:
+            logger.debug("Skipping invalid box: %s", box)
+    return valid_boxes
+
+
 def parse_detections(text: str, image_width: int, image_height: int) -> List[Dict[str, Any]]:
     """Parse grounding boxes from text and scale from 0-999 normalized coords to actual image dimensions
 
@@ -58,49 +210,39 @@ def parse_detections(text: str, image_width: int, image_height: int) -> List[Dic
         box format: [x1, y1, x2, y2] in actual pixel coordinates
     """
     boxes: List[Dict[str, Any]] = []
-    for m in DET_BLOCK.finditer(text or ""):
+    # Fast path: no detection blocks means nothing to parse
+    if not text or "<|det|>" not in text:
+        return boxes
+
+    for m in DET_BLOCK.finditer(text):
         label = m.group("label").strip()
         coords_str = m.group("coords").strip()
 
-        print(f"🔍 DEBUG: Found detection for '{label}'")
-        print(f"📦 Raw coords string (with brackets): {coords_str}")
+        logger.debug("Found detection for '%s'", label)
+        logger.debug("Raw coords string (with brackets): %s", coords_str)
 
         try:
-            import ast
-
-            # Parse the full bracket expression directly (handles single and multiple)
-            parsed = ast.literal_eval(coords_str)
-
-            # Normalize to a list of lists
-            if (
-                isinstance(parsed, list)
-                and len(parsed) == 4
-                and all(isinstance(n, (int, float)) for n in parsed)
-            ):
-                # Single box provided as [x1,y1,x2,y2]
-                box_coords = [parsed]
-                print("📦 Single box (flat list) detected")
-            elif isinstance(parsed, list):
-                box_coords = parsed
-                print(f"📦 Boxes detected: {len(box_coords)}")
+            if _INT_BOXES_RE.fullmatch(coords_str):
+                # Common case: plain integer boxes, so skip the list parser entirely
+                nums = list(map(int, _INT_RE.findall(coords_str)))
+                valid_boxes = list(zip(*[iter(nums)] * 4))
+                logger.debug("Boxes detected: %d", len(valid_boxes))
             else:
-                raise ValueError("Unsupported coords structure")
-
-            # Process each box
-            for idx, box in enumerate(box_coords):
-                if isinstance(box, (list, tuple)) and len(box) >= 4:
-                    # Scale from 0-999 normalized coords to actual pixels
-                    x1 = int(float(box[0]) / 999 * image_width)
-                    y1 = int(float(box[1]) / 999 * image_height)
-                    x2 = int(float(box[2]) / 999 * image_width)
-                    y2 = int(float(box[3]) / 999 * image_height)
-                    print(f"  Box {idx+1}: {box} → [{x1}, {y1}, {x2}, {y2}]")
-                    boxes.append({"label": label, "box": [x1, y1, x2, y2]})
-                else:
-                    print(f"  ⚠️ Skipping invalid box: {box}")
+                valid_boxes = _parse_box_list(coords_str)
+
+            if not valid_boxes:
+                continue
+
+            # Scale from 0-999 normalized coords to actual pixels in one pass
+            arr = np.asarray(valid_boxes, dtype=np.float64).reshape(-1, 4)
+            scaled = _scale_boxes(arr, float(image_width), float(image_height))
+
+            for idx, (box, scaled_box) in enumerate(zip(valid_boxes, scaled.tolist())):
+                logger.debug("Box %d: %s → %s", idx + 1, box, scaled_box)
+                boxes.append({"label": label, "box": scaled_box})
         except Exception as e:
-            print(f"❌ Parsing failed: {e}")
+            logger.warning("Parsing detection coords failed: %s", e)
             continue
 
-    print(f"🎯 Total boxes parsed: {len(boxes)}")
+    logger.debug("Total boxes parsed: %d", len(boxes))
     return boxes
@@ -6,11 +6,37 @@ Adapted from backend/main.py lifespan function (lines 34-72)
 """
 
 import os
+import tempfile
 from PySide6.QtCore import QThread, Signal, QObject
-import torch
-from transformers import AutoModel, AutoTokenizer
+from PIL import Image
 
 from core.vllm_client import VLLMClient
+from utils.logger import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Attention kernels to try, fastest first; fused kernels avoid materializing the full attention matrix
+_ATTN_IMPLEMENTATIONS = ("flash_attention_2", "sdpa", "eager")
+
+
+def _compile_error_types() -> tuple:
+    """Exception types raised by torch.compile (Dynamo tracing / Inductor codegen)
+
+    Returns:
+        Tuple of exception classes usable in an except clause
+    """
+    from torch._dynamo.exc import TorchDynamoException
+
+    # BackendCompilerFailed and Unsupported derive from TorchDynamoException;
+    # newer releases raise Inductor codegen failures as InductorError instead
+    errors = [TorchDynamoException]
+    try:
+        from torch._inductor.exc import InductorError
+        errors.append(InductorError)
+    except ImportError:
+        pass
+    return tuple(errors)
 
 
 class ModelLoadWorker(QThread):
@@ -22,7 +48,9 @@ class ModelLoadWorker(QThread):
 
     def __init__(self, model_name: str, hf_home: str, use_vllm: bool = False,
                  vllm_endpoint: str = "", vllm_api_key: str = "",
-                 vllm_timeout: float = 300.0, vllm_max_retries: int = 3):
+                 vllm_timeout: float = 300.0, vllm_max_retries: int = 3,
+                 vllm_max_concurrency: int = 8, offload_layers: bool = False,
+                 compile_model: bool = False):
         """Initialize worker with model configuration
 
         Args:
@@ -33,6 +61,9 @@ class ModelLoadWorker(QThread):
             vllm_api_key: vLLM API key (optional)
             vllm_timeout: vLLM request timeout in seconds (default: 300)
             vllm_max_retries: vLLM max retry attempts (default: 3)
+            vllm_max_concurrency: Maximum in-flight vLLM requests (default: 8)
+            offload_layers: Let Accelerate place layers that do not fit in VRAM on CPU
+            compile_model: Compile the local model forward with torch.compile
         """
         super().__init__()
         self.model_name = model_name
@@ -42,6 +73,9 @@ class ModelLoadWorker(QThread):
         self.vllm_api_key = vllm_api_key
         self.vllm_timeout = vllm_timeout
         self.vllm_max_retries = vllm_max_retries
+        self.vllm_max_concurrency = vllm_max_concurrency
+        self.offload_layers = offload_layers
+        self.compile_model = compile_model
 
     def run(self):
         """Load model and tokenizer or connect to vLLM (runs in background thread)"""
@@ -56,7 +90,8 @@ class ModelLoadWorker(QThread):
                     api_key=self.vllm_api_key if self.vllm_api_key else None,
                     model_name=self.model_name,
                     timeout=self.vllm_timeout,
-                    max_retries=self.vllm_max_retries
+                    max_retries=self.vllm_max_retries,
+                    max_concurrency=self.vllm_max_concurrency
                 )
 
                 # Test connection
@@ -75,10 +110,16 @@ class ModelLoadWorker(QThread):
 
             else:
                 # Local mode: Load transformer model
-                # Environment setup
+                # Environment setup, before transformers/huggingface_hub read it at import
                 os.environ.pop("TRANSFORMERS_CACHE", None)
                 os.makedirs(self.hf_home, exist_ok=True)
                 os.environ["HF_HOME"] = self.hf_home
+                # The hub client resolves cached snapshots from HUGGINGFACE_HUB_CACHE
+                os.environ.setdefault("HUGGINGFACE_HUB_CACHE", os.path.join(self.hf_home, "hub"))
+
+                # Imported here so vLLM mode never pays for torch/transformers
+                import torch
+                from transformers import AutoTokenizer
 
                 self.progress_signal.emit(f"🚀 Loading local model: {self.model_name}")
 
@@ -92,23 +133,30 @@ class ModelLoadWorker(QThread):
                 self.progress_signal.emit("📦 Loading tokenizer...")
 
                 # Load tokenizer (fast)
-                tokenizer = AutoTokenizer.from_pretrained(
-                    self.model_name,
+                tokenizer = self._from_pretrained(
+                    AutoTokenizer,
                     trust_remote_code=True,
                 )
 
                 self.progress_signal.emit("🔧 Loading model (this may take 10-30 seconds)...")
 
+                # Allow TF32 tensor cores for any fp32 matmuls/convolutions
+                torch.backends.cuda.matmul.allow_tf32 = True
+                torch.backends.cudnn.allow_tf32 = True
+
                 # Load model (slow, 5-30 seconds)
                 torch_dtype = torch.bfloat16
 
-                model = AutoModel.from_pretrained(
-                    self.model_name,
-                    trust_remote_code=True,
-                    use_safetensors=True,
-                    attn_implementation="eager",
-                    torch_dtype=torch_dtype,
-                ).eval().to("cuda")
+                if self.offload_layers:
+                    # Accelerate dispatches layers across GPU/CPU and moves them in on demand
+                    model = self._load_model(torch_dtype, device_map="auto").eval()
+                else:
+                    model = self._load_model(torch_dtype).eval().to("cuda")
+                for param in model.parameters():
+                    param.requires_grad_(False)
+
+                # Return allocator blocks left over from loading (CPU staging, fallbacks)
+                torch.cuda.empty_cache()
 
                 # Pad token setup
                 try:
@@ -119,6 +167,12 @@ class ModelLoadWorker(QThread):
                 except Exception:
                     pass
 
+                # Compile once here so the cost is hidden behind the loading dialog
+                # (opt-in; Accelerate's offload hooks move weights outside the graph)
+                if self.compile_model and not self.offload_layers:
+                    self.progress_signal.emit("🛠️ Compiling model and warming up...")
+                    self._compile_and_warm_up(model, tokenizer)
+
                 self.progress_signal.emit("✅ Model loaded successfully!")
 
                 # Emit success signal with model and tokenizer
@@ -128,6 +182,152 @@ class ModelLoadWorker(QThread):
             error_msg = f"Failed to initialize: {type(e).__name__}: {str(e)}"
             self.error_signal.emit(error_msg)
 
+    def _compile_and_warm_up(self, model, tokenizer):
+        """Compile the model forward pass with torch.compile and run one warmup inference
+
+        model.infer drives generation through model.forward, so the forward is
+        compiled in place. The default mode is used: CUDA graphs would be
+        re-recorded for every KV cache length and replayed from other threads.
+        Falls back to eager execution if compilation or the warmup fails, and
+        model.infer switches back to eager for good if a compiled run hits a
+        compiler error.
+
+        Args:
+            model: Loaded model on CUDA
+            tokenizer: Loaded tokenizer
+        """
+        import torch
+
+        eager_forward = model.forward
+        try:
+            model.forward = torch.compile(eager_forward, dynamic=True)
+
+            # Tiny dummy image so the first user request does not pay the compile cost
+            with tempfile.TemporaryDirectory(prefix="dsocr_warmup_") as warmup_dir, torch.inference_mode():
+                image_path = os.path.join(warmup_dir, "warmup.png")
+                Image.new("RGB", (64, 64), (255, 255, 255)).save(image_path)
+                model.infer(
+                    tokenizer,
+                    prompt="<image>\nFree OCR.",
+                    image_file=image_path,
+                    output_path=warmup_dir,
+                    save_results=False,
+                    eval_mode=True,
+                )
+        except Exception as e:
+            model.forward = eager_forward
+            self.progress_signal.emit(f"⚠️ torch.compile unavailable, using eager mode ({type(e).__name__})")
+            return
+
+        # The warmup only decodes a few tokens; real pages can still hit a shape
+        # the compiled graph fails on, so retry those runs in eager mode.
+        # Only compiler errors fall back: cancellation, CUDA OOM and input
+        # errors would fail the same way in eager mode and must propagate.
+        compile_errors = _compile_error_types()
+        model_infer = model.infer
+
+        def infer(*args, **kwargs):
+            try:
+                return model_infer(*args, **kwargs)
+            except compile_errors as e:
+                if model.forward is eager_forward:
+                    raise
+                logger.warning(f"⚠️ Compiled inference failed, switching to eager mode: {type(e).__name__}: {e}")
+                model.forward = eager_forward
+                return model_infer(*args, **kwargs)
+
+        model.infer = infer
+
+    def _load_model(self, torch_dtype, **kwargs):
+        """Load the model with the fastest attention implementation available
+
+        Args:
+            torch_dtype: Model weight dtype
+            **kwargs: Extra arguments forwarded to from_pretrained (e.g. device_map)
+
+        Returns:
+            Loaded model (on CPU)
+        """
+        from transformers import AutoModel
+
+        last_error = None
+        for attn_implementation in _ATTN_IMPLEMENTATIONS:
+            try:
+                model = self._from_pretrained(
+                    AutoModel,
+                    trust_remote_code=True,
+                    use_safetensors=True,
+                    attn_implementation=attn_implementation,
+                    torch_dtype=torch_dtype,
+                    **kwargs,
+                )
+                self.progress_signal.emit(f"⚡ Attention implementation: {attn_implementation}")
+                return model
+            except (ImportError, ValueError) as e:
+                # Kernel package missing or not supported by this model
+                last_error = e
+        raise last_error
+
+    def _from_pretrained(self, loader, **kwargs):
+        """Load from the local HF cache first, falling back to the Hub on a cache miss
+
+        Args:
+            loader: AutoTokenizer or AutoModel
+            **kwargs: Arguments forwarded to from_pretrained
+
+        Returns:
+            Loaded tokenizer or model
+        """
+        # Explicit cache_dir: huggingface_hub may already have been imported
+        # (and its cache constants fixed) before HF_HOME was set
+        kwargs.setdefault("cache_dir", os.environ["HUGGINGFACE_HUB_CACHE"])
+        try:
+            # Warm start: skip the network metadata round-trips when the snapshot is cached
+            return loader.from_pretrained(self.model_name, local_files_only=True, **kwargs)
+        except OSError:
+            return loader.from_pretrained(self.model_name, **kwargs)
+
+
+class ConnectionTestWorker(QThread):
+    """Worker thread for probing a vLLM endpoint without blocking the UI"""
+
+    finished_signal = Signal(bool, str)  # (success, message) from test_connection
+    error_signal = Signal(str)  # Error message when the client cannot be created
+
+    def __init__(self, endpoint: str, api_key: str, model_name: str,
+                 timeout: float, max_retries: int):
+        """Initialize worker with endpoint configuration
+
+        Args:
+            endpoint: vLLM endpoint URL
+            api_key: vLLM API key (empty for none)
+            model_name: Model expected on the endpoint
+            timeout: Request timeout in seconds
+            max_retries: Maximum retry attempts
+        """
+        super().__init__()
+        self.endpoint = endpoint
+        self.api_key = api_key
+        self.model_name = model_name
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+    def run(self):
+        """Create a client and test the connection"""
+        try:
+            client = VLLMClient(
+                endpoint=self.endpoint,
+                api_key=self.api_key if self.api_key else None,
+                model_name=self.model_name,
+                timeout=self.timeout,
+                max_retries=self.max_retries
+            )
+            success, message = client.test_connection()
+            client.close()
+            self.finished_signal.emit(success, message)
+        except Exception as e:
+            self.error_signal.emit(f"{type(e).__name__}: {str(e)}")
+
 
 class ModelManager(QObject):
     """Manager for DeepSeek-OCR model with async loading (local or vLLM)"""
@@ -146,7 +346,9 @@ class ModelManager(QObject):
 
     def load_model_async(self, model_name: str, hf_home: str, use_vllm: bool = False,
                          vllm_endpoint: str = "", vllm_api_key: str = "",
-                         vllm_timeout: float = 300.0, vllm_max_retries: int = 3):
+                         vllm_timeout: float = 300.0, vllm_max_retries: int = 3,
+                         vllm_max_concurrency: int = 8, offload_layers: bool = False,
+                         compile_model: bool = False):
         """Start loading model asynchronously (local or vLLM)
 
         Args:
@@ -157,6 +359,9 @@ class ModelManager(QObject):
             vllm_api_key: vLLM API key (optional)
             vllm_timeout: vLLM request timeout in seconds (default: 300)
             vllm_max_retries: vLLM max retry attempts (default: 3)
+            vllm_max_concurrency: Maximum in-flight vLLM requests (default: 8)
+            offload_layers: Offload layers that do not fit in VRAM to CPU (local mode)
+            compile_model: Compile the model forward with torch.compile (local mode)
         """
         self.use_vllm = use_vllm
 
@@ -168,7 +373,10 @@ class ModelManager(QObject):
             vllm_endpoint=vllm_endpoint,
             vllm_api_key=vllm_api_key,
             vllm_timeout=vllm_timeout,
-            vllm_max_retries=vllm_max_retries
+            vllm_max_retries=vllm_max_retries,
+            vllm_max_concurrency=vllm_max_concurrency,
+            offload_layers=offload_layers,
+            compile_model=compile_model
         )
 
         # Connect signals
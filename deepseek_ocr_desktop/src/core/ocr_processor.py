@@ -5,27 +5,101 @@ Supports both local transformer model and remote vLLM endpoint
 Adapted from backend/main.py /api/ocr endpoint (lines 258-386)
 """
 
+import atexit
+import logging
 import os
+import queue
 import tempfile
 import shutil
-from typing import Optional
+import threading
+import traceback
+from typing import List, Optional
 from PySide6.QtCore import QThread, Signal
 from PIL import Image
 
+try:
+    # Optional: reads only the header bytes to get image dimensions
+    import imagesize
+except ImportError:
+    imagesize = None
+
 from core.prompt_builder import build_prompt
-from core.coordinate_parser import parse_detections, clean_grounding_text
+from core.coordinate_parser import parse_detections, clean_grounding_text, find_grounding_tags
+from core import async_runtime
 from core.vllm_client import VLLMClient
 from utils.logger import get_logger
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Scratch output directory shared by every local inference, created on first use
+_scratch_dir: Optional[str] = None
+_scratch_lock = threading.Lock()
+
+
+def _get_scratch_dir() -> str:
+    """Get the process-wide scratch output directory, creating it on first use
+
+    The local model requires an output_path even with save_results=False,
+    so one directory is reused across inferences.
+
+    Returns:
+        Path to the scratch directory
+    """
+    global _scratch_dir
+    with _scratch_lock:
+        if _scratch_dir is None or not os.path.isdir(_scratch_dir):
+            _scratch_dir = tempfile.mkdtemp(prefix="dsocr_scratch_")
+            atexit.register(shutil.rmtree, _scratch_dir, ignore_errors=True)
+        return _scratch_dir
+
+
+def normalize_model_output(res) -> str:
+    """Normalize a model.infer response (str, {"text": ...} dict, or list/tuple) to stripped text
+
+    Args:
+        res: Raw return value of model.infer
+
+    Returns:
+        Response text, or "" if the response has no usable text
+    """
+    match res:
+        case str():
+            text = res
+        case {"text": value}:
+            text = str(value)
+        case list() | tuple():
+            text = "\n".join(map(str, res))
+        case _:
+            return ""
+    return text.strip()
+
+
+def _get_image_size(image_path: str) -> tuple[int, int]:
+    """Get image dimensions without decoding pixel data
+
+    Args:
+        image_path: Path to image file
+
+    Returns:
+        Tuple of (width, height)
+    """
+    if imagesize is not None:
+        width, height = imagesize.get(image_path)
+        if width > 0 and height > 0:
+            return width, height
+
+    # Fallback (or format unknown to imagesize): PIL parses the header lazily
+    with Image.open(image_path) as im:
+        return im.size
+
 
 class OCRWorker(QThread):
     """Worker thread for OCR inference"""
 
     progress_signal = Signal(str)  # Progress message
     result_signal = Signal(dict)   # OCR result dict
+    partial_result_signal = Signal(str)  # Streamed output text as it arrives (vLLM mode)
     error_signal = Signal(str)     # Error message
 
     def __init__(self, model, tokenizer, image_path: str, params: dict):
@@ -53,16 +127,25 @@ class OCRWorker(QThread):
         self.image_path = image_path
         self.params = params
         self.is_vllm = isinstance(model, VLLMClient)
+        self.is_cancelled = False
+        # Pick the backend once instead of branching on every image
+        self._infer_text = self._infer_text_vllm if self.is_vllm else self._infer_text_local
+        # Only a local run that persists artifacts can leave a result.mmd to fall back on;
+        # the vLLM path never touches the filesystem
+        self._needs_out_dir = not self.is_vllm and (
+            params.get('save_results', False) or params.get('test_compress', False)
+        )
 
         logger.info(f"OCRWorker initialized for: {image_path}")
-        logger.debug(f"Mode: {'vLLM' if self.is_vllm else 'Local'}")
-        logger.debug(f"Parameters: {params}")
+        logger.debug("Mode: %s", 'vLLM' if self.is_vllm else 'Local')
+        logger.debug("Parameters: %s", params)
+
+    def cancel(self):
+        """Cancel the worker: an in-flight inference finishes but its result is discarded"""
+        self.is_cancelled = True
 
     def run(self):
         """Run OCR inference (executes in background thread)"""
-        tmp_img = None
-        out_dir = None
-
         try:
             logger.info("="*60)
             logger.info("Starting image OCR processing")
@@ -70,160 +153,384 @@ class OCRWorker(QThread):
 
             self.progress_signal.emit("📋 Building prompt...")
             logger.info("Building prompt...")
-
-            # Build prompt based on mode
-            mode = self.params.get('mode', 'plain_ocr')
-            grounding = self.params.get('grounding', False)
-            prompt_text = build_prompt(
-                mode=mode,
-                user_prompt=self.params.get('prompt', ''),
-                grounding=grounding,
-                find_term=self.params.get('find_term', None),
-                schema=self.params.get('schema', None),
-                include_caption=self.params.get('include_caption', False),
-            )
-            logger.info(f"Prompt built - mode: {mode}, grounding: {grounding}")
-            logger.debug(f"Prompt length: {len(prompt_text)}")
+            prompt_text = self._build_prompt_text()
 
             self.progress_signal.emit("📐 Getting image dimensions...")
             logger.info("Getting image dimensions...")
+            orig_w, orig_h = self._probe_image_size(self.image_path)
+
+            self.progress_signal.emit("🔍 Running OCR inference (this may take 10-30 seconds)...")
+            result = self._ocr_image(prompt_text, self.image_path, orig_w, orig_h)
+
+            if self.is_cancelled:
+                logger.info(f"Discarding result for cancelled OCR: {self.image_path}")
+                return
+
+            logger.info("="*60)
+            logger.info("Image OCR processing complete!")
+            logger.info(f"  Mode: {result['metadata']['mode']}")
+            logger.info(f"  Text length: {len(result['text'])}")
+            logger.info(f"  Bounding boxes: {len(result['boxes'])}")
+            logger.info(f"  Image dimensions: {orig_w}x{orig_h}")
+            logger.info("="*60)
+
+            self.progress_signal.emit("✅ OCR completed successfully!")
+            self.result_signal.emit(result)
+
+        except Exception as e:
+            error_msg = f"OCR Error: {type(e).__name__}: {str(e)}\n{traceback.format_exc()}"
+            logger.error(error_msg)
+            if not self.is_cancelled:
+                self.error_signal.emit(error_msg)
+
+    def _build_prompt_text(self) -> str:
+        """Build the model prompt from the worker parameters
+
+        Returns:
+            Formatted prompt string
+        """
+        mode = self.params.get('mode', 'plain_ocr')
+        grounding = self.params.get('grounding', False)
+        prompt_text = build_prompt(
+            mode=mode,
+            user_prompt=self.params.get('prompt', ''),
+            grounding=grounding,
+            find_term=self.params.get('find_term', None),
+            schema=self.params.get('schema', None),
+            include_caption=self.params.get('include_caption', False),
+        )
+        logger.info(f"Prompt built - mode: {mode}, grounding: {grounding}")
+        logger.debug("Prompt length: %d", len(prompt_text))
+        return prompt_text
+
+    @staticmethod
+    def _probe_image_size(image_path: str) -> tuple[Optional[int], Optional[int]]:
+        """Get original image dimensions for coordinate scaling
+
+        Args:
+            image_path: Path to image file
+
+        Returns:
+            Tuple of (width, height), or (None, None) if unreadable
+        """
+        try:
+            orig_w, orig_h = _get_image_size(image_path)
+            logger.info(f"Image dimensions: {orig_w}x{orig_h}")
+            return orig_w, orig_h
+        except Exception as e:
+            logger.warning(f"Failed to get image dimensions: {e}")
+            return None, None
+
+    def _infer_text_vllm(self, prompt_text: str, image_path: str) -> str:
+        """Run inference on the vLLM endpoint (bound to _infer_text in vLLM mode)
+
+        Args:
+            prompt_text: Prompt built by _build_prompt_text
+            image_path: Path to image file
 
-            # Get original image dimensions for coordinate scaling
+        Returns:
+            Normalized model output text
+        """
+        logger.info("Using vLLM remote inference")
+        # Stream the output so the GUI can show it while the rest is generated
+        parts = []
+        stream = self.model.infer_stream(prompt_text, image_file=image_path)
+        try:
+            for delta in stream:
+                if self.is_cancelled:
+                    break
+                parts.append(delta)
+                self.partial_result_signal.emit(delta)
+        finally:
+            # Abort the request if we stopped early
+            stream.close()
+        return normalize_model_output("".join(parts))
+
+    def _infer_text_local(self, prompt_text: str, image_path: str) -> str:
+        """Run inference with the local model (bound to _infer_text in local mode)
+
+        Args:
+            prompt_text: Prompt built by _build_prompt_text
+            image_path: Path to image file
+
+        Returns:
+            Normalized model output text
+        """
+        out_dir = _get_scratch_dir()
+        mmd = os.path.join(out_dir, "result.mmd")
+
+        if self._needs_out_dir:
+            # Drop the previous run's output so the fallback below only sees this run
             try:
-                with Image.open(self.image_path) as im:
-                    orig_w, orig_h = im.size
-                logger.info(f"Image dimensions: {orig_w}x{orig_h}")
-            except Exception as e:
-                logger.warning(f"Failed to get image dimensions: {e}")
-                orig_w = orig_h = None
+                os.remove(mmd)
+            except FileNotFoundError:
+                pass
+
+        # Extract processing parameters
+        base_size = self.params.get('base_size', 1024)
+        image_size = self.params.get('image_size', 640)
+        crop_mode = self.params.get('crop_mode', True)
+        logger.debug("OCR params: base_size=%s, image_size=%s, crop_mode=%s", base_size, image_size, crop_mode)
+
+        logger.info("Using local transformer model")
+        import torch  # local model only; already loaded by ModelManager
+        # No autograd bookkeeping during inference (blocking call)
+        with torch.inference_mode():
+            res = self.model.infer(
+                self.tokenizer,
+                prompt=prompt_text,
+                image_file=image_path,
+                output_path=out_dir,
+                base_size=base_size,
+                image_size=image_size,
+                crop_mode=crop_mode,
+                save_results=self.params.get('save_results', False),
+                test_compress=self.params.get('test_compress', False),
+                eval_mode=True,
+            )
+        text = normalize_model_output(res)
 
-            # Create temporary output directory
-            out_dir = tempfile.mkdtemp(prefix="dsocr_")
-            logger.debug(f"Temporary output directory: {out_dir}")
+        # Fallback: check output file (only written when artifacts are persisted)
+        if not text and self._needs_out_dir:
+            # One stat covers both existence and emptiness
+            try:
+                mmd_size = os.stat(mmd).st_size
+            except FileNotFoundError:
+                mmd_size = 0
+            if mmd_size:
+                logger.debug("Reading fallback result from: %s", mmd)
+                with open(mmd, "rb") as fh:
+                    text = fh.read().decode("utf-8").strip()
+        return text
+
+    def _ocr_image(self, prompt_text: str, image_path: str,
+                   orig_w: Optional[int], orig_h: Optional[int]) -> dict:
+        """Run inference on one image and post-process the output
 
-            self.progress_signal.emit("🔍 Running OCR inference (this may take 10-30 seconds)...")
-            logger.info("Running OCR inference...")
+        Args:
+            prompt_text: Prompt built by _build_prompt_text
+            image_path: Path to image file
+            orig_w: Original image width (None if unknown)
+            orig_h: Original image height (None if unknown)
 
-            # Extract processing parameters
-            base_size = self.params.get('base_size', 1024)
-            image_size = self.params.get('image_size', 640)
-            crop_mode = self.params.get('crop_mode', True)
-            logger.debug(f"OCR params: base_size={base_size}, image_size={image_size}, crop_mode={crop_mode}")
+        Returns:
+            OCR result dict
+        """
+        logger.info("Running OCR inference...")
+        text = self._infer_text(prompt_text, image_path)
+        logger.info("OCR inference complete")
+        self.progress_signal.emit("📊 Processing results...")
+        return self._build_result(text, orig_w, orig_h)
 
-            # Run model inference (blocking call)
-            if self.is_vllm:
-                # vLLM mode: Call remote API
-                logger.info("Using vLLM remote inference")
-                res = self.model.infer(
-                    prompt=prompt_text,
-                    image_file=self.image_path,
-                    base_size=base_size,
-                    image_size=image_size,
-                    crop_mode=crop_mode,
-                )
-            else:
-                # Local mode: Use transformer model
-                logger.info("Using local transformer model")
-                res = self.model.infer(
-                    self.tokenizer,
-                    prompt=prompt_text,
-                    image_file=self.image_path,
-                    output_path=out_dir,
-                    base_size=base_size,
-                    image_size=image_size,
-                    crop_mode=crop_mode,
-                    save_results=False,
-                    test_compress=self.params.get('test_compress', False),
-                    eval_mode=True,
-                )
-
-            logger.info("OCR inference complete")
-            self.progress_signal.emit("📊 Processing results...")
-            logger.info("Processing results...")
-
-            # Normalize response
-            if isinstance(res, str):
-                text = res.strip()
-            elif isinstance(res, dict) and "text" in res:
-                text = str(res["text"]).strip()
-            elif isinstance(res, (list, tuple)):
-                text = "\n".join(map(str, res)).strip()
-            else:
-                text = ""
-
-            logger.debug(f"Text extracted - length: {len(text)}")
-
-            # Fallback: check output file
-            if not text:
-                mmd = os.path.join(out_dir, "result.mmd")
-                if os.path.exists(mmd):
-                    logger.debug(f"Reading fallback result from: {mmd}")
-                    with open(mmd, "r", encoding="utf-8") as fh:
-                        text = fh.read().strip()
-            if not text:
-                logger.warning("No text returned by model")
-                text = "No text returned by model."
+    def _build_result(self, text: str, orig_w: Optional[int], orig_h: Optional[int]) -> dict:
+        """Post-process normalized model output into an OCR result
 
+        Args:
+            text: Normalized model output text
+            orig_w: Original image width (None if unknown)
+            orig_h: Original image height (None if unknown)
+
+        Returns:
+            OCR result dict
+        """
+        logger.info("Processing results...")
+        logger.debug("Text extracted - length: %d", len(text))
+
+        if not text:
+            logger.warning("No text returned by model")
+            text = "No text returned by model."
+
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Raw text preview: {text[:200]}...")
 
-            # Parse grounding boxes with proper coordinate scaling
-            boxes = []
-            if ("<|det|>" in text or "<|ref|>" in text) and orig_w and orig_h:
-                logger.info("Parsing bounding boxes...")
-                boxes = parse_detections(text, orig_w, orig_h)
-                logger.info(f"Parsed {len(boxes)} bounding boxes")
-
-            # Clean grounding tags from display text, but keep the labels
-            display_text = text
-            if "<|ref|>" in text or "<|grounding|>" in text:
-                logger.debug("Cleaning grounding tags from display text")
-                display_text = clean_grounding_text(text)
-
-            # If display text is empty after cleaning but we have boxes, show the labels
-            if not display_text and boxes:
-                logger.debug("Display text empty, using box labels")
-                display_text = ", ".join([b["label"] for b in boxes])
-
-            logger.debug(f"Display text length: {len(display_text)}")
-
-            # Emit result
-            result = {
-                'success': True,
-                'text': display_text,
-                'raw_text': text,
-                'boxes': boxes,
-                'image_dims': {'w': orig_w, 'h': orig_h},
-                'metadata': {
-                    'mode': self.params.get('mode', 'plain_ocr'),
-                    'grounding': self.params.get('grounding', False),
-                    'base_size': self.params.get('base_size', 1024),
-                    'image_size': self.params.get('image_size', 640),
-                    'crop_mode': self.params.get('crop_mode', True),
-                }
+        tags = find_grounding_tags(text)
+
+        # Parse grounding boxes with proper coordinate scaling
+        boxes = []
+        if "det" in tags and orig_w and orig_h:
+            logger.info("Parsing bounding boxes...")
+            boxes = parse_detections(text, orig_w, orig_h)
+            logger.info(f"Parsed {len(boxes)} bounding boxes")
+
+        # Clean grounding tags from display text, but keep the labels
+        display_text = text
+        if "ref" in tags or "grounding" in tags:
+            logger.debug("Cleaning grounding tags from display text")
+            display_text = clean_grounding_text(text)
+
+        # If display text is empty after cleaning but we have boxes, show the labels
+        if not display_text and boxes:
+            logger.debug("Display text empty, using box labels")
+            display_text = ", ".join([b["label"] for b in boxes])
+
+        logger.debug("Display text length: %d", len(display_text))
+
+        return {
+            'success': True,
+            'text': display_text,
+            'raw_text': text,
+            'boxes': boxes,
+            'image_dims': {'w': orig_w, 'h': orig_h},
+            'metadata': {
+                'mode': self.params.get('mode', 'plain_ocr'),
+                'grounding': self.params.get('grounding', False),
+                'base_size': self.params.get('base_size', 1024),
+                'image_size': self.params.get('image_size', 640),
+                'crop_mode': self.params.get('crop_mode', True),
             }
+        }
+
+
+class OCRBatchWorker(OCRWorker):
+    """Worker thread for OCR over several images in one thread
+
+    A producer thread probes the next images (header read, dimensions) into a
+    small bounded queue while the model runs inference on the current one.
+    In vLLM mode all images are sent concurrently instead.
+    """
+
+    image_result_signal = Signal(int, dict)  # (image_index, result)
+    batch_finished_signal = Signal(list)     # Results in input order (None for failed images)
+
+    PREFETCH_DEPTH = 2  # Images prepared ahead of the one being inferred
+
+    def __init__(self, model, tokenizer, image_paths: List[str], params: dict):
+        """Initialize batch OCR worker
 
+        Args:
+            model: DeepSeek-OCR model or VLLMClient
+            tokenizer: Model tokenizer (None for vLLM mode)
+            image_paths: Paths to image files, processed in order
+            params: Processing parameters dict (same keys as OCRWorker)
+        """
+        super().__init__(model, tokenizer, image_paths[0] if image_paths else "", params)
+        self.image_paths = list(image_paths)
+        self._prefetch_stop = threading.Event()
+
+        logger.info(f"OCRBatchWorker initialized for {len(self.image_paths)} images")
+
+    def _prefetch(self, prepared: queue.Queue):
+        """Producer: prepare images ahead of inference (runs in a helper thread)
+
+        Args:
+            prepared: Queue receiving (index, path, width, height), then None when done
+        """
+        for idx, path in enumerate(self.image_paths):
+            if self._prefetch_stop.is_set():
+                return
+            orig_w, orig_h = self._probe_image_size(path)
+            if not self._put_prefetched(prepared, (idx, path, orig_w, orig_h)):
+                return
+        self._put_prefetched(prepared, None)
+
+    def _put_prefetched(self, prepared: queue.Queue, item) -> bool:
+        """Put an item on the prefetch queue, giving up once the consumer has stopped
+
+        Returns:
+            True if the item was queued
+        """
+        while not self._prefetch_stop.is_set():
+            try:
+                prepared.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run_vllm_batch(self, prompt_text: str, results: List[Optional[dict]]):
+        """Send every image to vLLM at once so the server batches them
+
+        Args:
+            prompt_text: Prompt shared by all images
+            results: Per-image results, filled in place (None for failed images)
+        """
+        total = len(self.image_paths)
+        self.progress_signal.emit(f"🔍 Processing {total} images...")
+        sizes = [self._probe_image_size(path) for path in self.image_paths]
+        texts = self.model.infer_many(
+            [(prompt_text, path) for path in self.image_paths], return_exceptions=True
+        )
+
+        if self.is_cancelled:
+            logger.warning("Batch OCR cancelled, results discarded")
+            return
+
+        for idx, (text, (orig_w, orig_h)) in enumerate(zip(texts, sizes)):
+            if isinstance(text, BaseException):
+                logger.error(f"Image {idx + 1}/{total} failed ({self.image_paths[idx]}): "
+                             f"{type(text).__name__}: {text}")
+                continue
+            result = self._build_result(normalize_model_output(text), orig_w, orig_h)
+            results[idx] = result
+            self.image_result_signal.emit(idx, result)
+
+        done = sum(r is not None for r in results)
+        logger.info(f"Batch OCR processing complete! {done}/{total} images processed")
+        self.progress_signal.emit(f"✅ Batch OCR completed: {done}/{total} images")
+        self.batch_finished_signal.emit(results)
+
+    def run(self):
+        """Run OCR inference over all images (executes in background thread)"""
+        total = len(self.image_paths)
+        results: List[Optional[dict]] = [None] * total
+        prepared: queue.Queue = queue.Queue(maxsize=self.PREFETCH_DEPTH)
+        producer = threading.Thread(
+            target=self._prefetch, args=(prepared,), name="dsocr_prefetch", daemon=True
+        )
+
+        try:
             logger.info("="*60)
-            logger.info("Image OCR processing complete!")
-            logger.info(f"  Mode: {mode}")
-            logger.info(f"  Text length: {len(display_text)}")
-            logger.info(f"  Bounding boxes: {len(boxes)}")
-            logger.info(f"  Image dimensions: {orig_w}x{orig_h}")
+            logger.info(f"Starting batch OCR processing ({total} images)")
             logger.info("="*60)
 
-            self.progress_signal.emit("✅ OCR completed successfully!")
-            self.result_signal.emit(result)
+            # Prompt depends only on params, so build it once for the whole batch
+            prompt_text = self._build_prompt_text()
+
+            if self.is_vllm:
+                self._run_vllm_batch(prompt_text, results)
+                return
+
+            producer.start()
+
+            while True:
+                item = prepared.get()
+                if item is None:
+                    break
+                if self.is_cancelled:
+                    break
+
+                idx, image_path, orig_w, orig_h = item
+                self.progress_signal.emit(f"🔍 Processing image {idx + 1}/{total}...")
+                try:
+                    result = self._ocr_image(prompt_text, image_path, orig_w, orig_h)
+                except Exception as e:
+                    # Skip failed images, like failed PDF pages
+                    logger.error(f"Image {idx + 1}/{total} failed ({image_path}): {type(e).__name__}: {e}")
+                    continue
+
+                if self.is_cancelled:
+                    break
+                results[idx] = result
+                self.image_result_signal.emit(idx, result)
+
+            if self.is_cancelled:
+                logger.warning("Batch OCR cancelled, remaining images skipped")
+                return
+
+            done = sum(r is not None for r in results)
+            logger.info(f"Batch OCR processing complete! {done}/{total} images processed")
+            self.progress_signal.emit(f"✅ Batch OCR completed: {done}/{total} images")
+            self.batch_finished_signal.emit(results)
 
         except Exception as e:
-            import traceback
             error_msg = f"OCR Error: {type(e).__name__}: {str(e)}\n{traceback.format_exc()}"
             logger.error(error_msg)
-            self.error_signal.emit(error_msg)
+            if not self.is_cancelled:
+                self.error_signal.emit(error_msg)
 
         finally:
-            # Cleanup temporary directory
-            if out_dir and os.path.exists(out_dir):
-                logger.debug(f"Cleaning up temporary directory: {out_dir}")
-                shutil.rmtree(out_dir, ignore_errors=True)
+            # Release the producer if it is blocked on a full queue
+            self._prefetch_stop.set()
 
 
 class OCRProcessor:
@@ -239,6 +546,8 @@ class OCRProcessor:
         self.model = model
         self.tokenizer = tokenizer
         self.current_worker = None
+        # Superseded workers still running; a QThread must not be destroyed while running
+        self._retired_workers = set()
 
     def process_image(self, image_path: str, params: dict) -> OCRWorker:
         """Start OCR processing for an image
@@ -250,10 +559,7 @@ class OCRProcessor:
         Returns:
             OCRWorker thread (caller should connect signals and start)
         """
-        # Stop previous worker if running
-        if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.quit()
-            self.current_worker.wait()
+        self._retire_current_worker()
 
         # Create new worker
         self.current_worker = OCRWorker(
@@ -265,6 +571,39 @@ class OCRProcessor:
 
         return self.current_worker
 
+    def process_batch(self, image_paths: List[str], params: dict) -> OCRBatchWorker:
+        """Start OCR processing for several images in a single worker
+
+        Args:
+            image_paths: Paths to image files
+            params: Processing parameters
+
+        Returns:
+            OCRBatchWorker thread (caller should connect signals and start)
+        """
+        self._retire_current_worker()
+
+        self.current_worker = OCRBatchWorker(
+            self.model,
+            self.tokenizer,
+            image_paths,
+            params
+        )
+
+        return self.current_worker
+
+    def _retire_current_worker(self):
+        """Cancel a running worker without blocking the UI thread on its inference
+
+        The worker finishes in the background and emits nothing; the processor
+        holds a reference to it until its thread exits.
+        """
+        worker = self.current_worker
+        if worker and worker.isRunning():
+            worker.cancel()
+            self._retired_workers.add(worker)
+            worker.finished.connect(lambda w=worker: self._retired_workers.discard(w))
+
     def is_processing(self) -> bool:
         """Check if currently processing
 
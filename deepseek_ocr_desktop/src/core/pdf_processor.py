@@ -5,31 +5,54 @@ Supports both local transformer model and remote vLLM endpoint
 Adapted from backend/main.py /api/process-pdf endpoint
 """
 
+import asyncio
+import concurrent.futures
 import json
+import logging
 import os
+import queue
 import tempfile
 import shutil
-from typing import Dict, Any, Optional
+import threading
+import traceback
+from collections import deque
+from typing import Dict, Any, Iterator, List, Optional
 from PySide6.QtCore import QThread, Signal
 from PIL import Image
 import io
 
 # Import utilities
 from utils.pdf_utils import (
-    pdf_to_images_high_quality,
+    pdf_page_count,
+    pdf_to_images_iter,
     extract_ref_patterns,
     crop_images_from_refs,
     clean_markdown_content
 )
 from utils.format_converter import DocumentConverter
 from core.prompt_builder import build_prompt
-from core.coordinate_parser import parse_detections, clean_grounding_text
+from core.coordinate_parser import parse_detections, clean_grounding_text, find_grounding_tags
+from core.ocr_processor import normalize_model_output
+from core import async_runtime
 from core.vllm_client import VLLMClient
 from utils.logger import get_logger, log_pdf_page
 
 # Initialize logger
 logger = get_logger(__name__)
 
+_SEP = "=" * 60
+
+# Upper bound on page progress updates per document, to keep the GUI event queue short
+_MAX_PROGRESS_UPDATES = 100
+
+# The local model is shared by every worker: a retiring worker's in-flight page
+# must finish (or abort) before the next worker's page starts on the GPU
+_local_inference_lock = threading.Lock()
+
+
+class _InferenceCancelled(Exception):
+    """Raised from a model forward hook to abort a cancelled page mid-generation"""
+
 
 class PDFWorker(QThread):
     """Worker thread for processing PDF documents"""
@@ -39,6 +62,9 @@ class PDFWorker(QThread):
     finished_signal = Signal(dict)  # Final result with converted document
     error_signal = Signal(str)  # Error message
     status_signal = Signal(str)  # Status updates
+    partial_content_signal = Signal(str)  # Next chunk of a streamed markdown/html document
+
+    RASTER_QUEUE_SIZE = 4  # Pages rendered ahead of the one being processed
 
     def __init__(self, model, tokenizer, pdf_path: str, params: Dict[str, Any]):
         """Initialize PDF worker
@@ -56,21 +82,40 @@ class PDFWorker(QThread):
         self.params = params
         self.is_cancelled = False
         self.is_vllm = isinstance(model, VLLMClient)
+        self._raster_stop = threading.Event()
+        # Serializes next() on the page iterator (from event loop threads) with close()
+        self._pages_lock = threading.Lock()
+        self._vllm_future: Optional[concurrent.futures.Future] = None
+        # Page post-processing (box parsing, cropping, cleanup) overlaps the next page's inference
+        self._postproc_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="dsocr_pdf_postproc"
+        )
+
+        # Incremental conversion state (markdown/html only), see _stream_page
+        self._stream_converter: Optional[DocumentConverter] = None
+        self._stream_chunks: List[str] = []
+        self._stream_pending: Dict[int, Optional[Dict[str, Any]]] = {}
+        self._stream_next_page = 1
 
         logger.info(f"PDFWorker initialized for: {pdf_path}")
-        logger.debug(f"Mode: {'vLLM' if self.is_vllm else 'Local'}")
-        logger.debug(f"Parameters: {params}")
+        logger.debug("Mode: %s", 'vLLM' if self.is_vllm else 'Local')
+        logger.debug("Parameters: %s", params)
 
     def cancel(self):
-        """Cancel the processing"""
+        """Cancel the processing, aborting in-flight inference"""
         self.is_cancelled = True
+        # vLLM: cancelling the batch coroutine cancels every outstanding request.
+        # Local: the forward hook installed by _process_page stops generation.
+        future = self._vllm_future
+        if future is not None:
+            future.cancel()
 
     def run(self):
         """Process PDF document"""
         try:
-            logger.info("="*60)
+            logger.info(_SEP)
             logger.info("Starting PDF processing")
-            logger.info("="*60)
+            logger.info(_SEP)
 
             # Extract parameters
             output_format = self.params.get('output_format', 'markdown')
@@ -83,72 +128,107 @@ class PDFWorker(QThread):
             test_compress = self.params.get('test_compress', False)
 
             logger.info(f"Output format: {output_format}, DPI: {dpi}, Extract images: {extract_images}")
-            logger.debug(f"OCR params: base_size={base_size}, image_size={image_size}, crop_mode={crop_mode}")
+            logger.debug("OCR params: base_size=%s, image_size=%s, crop_mode=%s", base_size, image_size, crop_mode)
 
             # Read PDF file
             self.status_signal.emit("📖 Reading PDF file...")
             logger.info(f"Reading PDF file: {self.pdf_path}")
             with open(self.pdf_path, 'rb') as f:
                 pdf_bytes = f.read()
-            logger.debug(f"PDF file size: {len(pdf_bytes)} bytes")
+            logger.debug("PDF file size: %d bytes", len(pdf_bytes))
 
-            # Convert PDF to images
-            self.status_signal.emit(f"🔄 Converting PDF to images at {dpi} DPI...")
-            logger.info(f"Converting PDF to images at {dpi} DPI...")
-            images = pdf_to_images_high_quality(pdf_bytes, dpi=dpi)
-            total_pages = len(images)
-            logger.info(f"PDF converted to {total_pages} images")
+            total_pages = pdf_page_count(pdf_bytes)
+            logger.info(f"PDF has {total_pages} pages")
 
             if total_pages == 0:
                 logger.error("PDF contains no pages")
                 self.error_signal.emit("PDF contains no pages")
                 return
 
-            self.status_signal.emit(f"📄 Processing {total_pages} pages...")
+            # Build prompt for plain OCR once (PDF processing always uses plain OCR);
+            # an identical prompt on every page also lets vLLM reuse its prefix cache
+            prompt = build_prompt(
+                mode='plain_ocr',
+                user_prompt='',
+                grounding=False,
+                find_term=None,
+                schema=None,
+                include_caption=include_caption
+            )
+            logger.debug("Prompt built (length: %d)", len(prompt))
+
+            # Markdown/HTML output is built and emitted page by page, in page order
+            self._begin_stream(output_format)
+
+            # Pages are rendered in a helper thread while earlier pages are OCR'd
+            self.status_signal.emit(f"📄 Processing {total_pages} pages at {dpi} DPI...")
+            logger.info(f"Converting PDF to images at {dpi} DPI while processing...")
+            pages = self._iter_rasterized_pages(pdf_bytes, dpi)
 
             # Process each page
             pages_content = []
             all_extracted_images = []
 
-            for page_idx, img in enumerate(images):
-                if self.is_cancelled:
+            if self.is_vllm:
+                # vLLM mode: submit all pages at once and let the server batch them
+                self._vllm_future = async_runtime.submit(
+                    self._process_pages_vllm_batched(pages, total_pages, prompt, extract_images, base_size)
+                )
+                try:
+                    page_results = self._vllm_future.result()
+                except concurrent.futures.CancelledError:
+                    page_results = None
+                finally:
+                    self._vllm_future = None
+                if page_results is None:
                     logger.warning("Processing cancelled by user")
                     self.error_signal.emit("Processing cancelled by user")
                     return
 
-                # Update progress
-                page_num = page_idx + 1
-                log_pdf_page(logger, page_num, total_pages, "starting")
-                self.page_progress_signal.emit(page_num, total_pages)
-                self.status_signal.emit(f"🔍 Processing page {page_num}/{total_pages}...")
-
-                # Process page
-                page_result = self._process_page(
-                    img, page_num,
-                    include_caption=include_caption,
-                    extract_images=extract_images,
-                    base_size=base_size,
-                    image_size=image_size,
-                    crop_mode=crop_mode,
-                    test_compress=test_compress
-                )
-
-                if page_result is None:
-                    logger.warning(f"Page {page_num} processing failed, skipping")
-                    continue  # Skip failed pages
-
-                logger.info(f"Page {page_num} processed successfully - text length: {len(page_result.get('text', ''))}")
-                pages_content.append(page_result)
-
-                # Collect extracted images
-                if 'extracted_images' in page_result:
-                    img_count = len(page_result['extracted_images'])
-                    logger.debug(f"Page {page_num}: extracted {img_count} images")
+                for page_num in sorted(page_results):
+                    page_result = page_results[page_num]
+                    pages_content.append(page_result)
                     all_extracted_images.extend(page_result['extracted_images'])
-
-                # Emit page completion
-                self.page_complete_signal.emit(page_num, page_result)
-                log_pdf_page(logger, page_num, total_pages, "completed")
+            else:
+                # Local mode: one page at a time on the GPU. All pages share one
+                # scratch directory, removed once the document is done.
+                work_dir = tempfile.mkdtemp(prefix="dsocr_pdf_")
+                logger.debug("PDF work directory: %s", work_dir)
+                postprocessing = deque()  # (page_num, post-processing future or None if failed)
+                try:
+                    for page_idx, img in enumerate(pages):
+                        if self.is_cancelled:
+                            logger.warning("Processing cancelled by user")
+                            self.error_signal.emit("Processing cancelled by user")
+                            return
+
+                        # Update progress
+                        page_num = page_idx + 1
+                        logger.debug("PDF Page %d/%d - starting", page_num, total_pages)
+                        self._emit_progress(page_num, total_pages, "🔍 Processing page {done}/{total}...")
+
+                        # Run inference; post-processing continues in the pool while
+                        # the next page is inferred
+                        postprocessing.append((page_num, self._process_page(
+                            img, page_num, prompt, work_dir,
+                            extract_images=extract_images,
+                            base_size=base_size,
+                            image_size=image_size,
+                            crop_mode=crop_mode,
+                            test_compress=test_compress
+                        )))
+
+                        # Collect finished pages, in page order
+                        while postprocessing and (postprocessing[0][1] is None or postprocessing[0][1].done()):
+                            self._collect_page(*postprocessing.popleft(), total_pages,
+                                               pages_content, all_extracted_images)
+
+                    while postprocessing:
+                        self._collect_page(*postprocessing.popleft(), total_pages,
+                                           pages_content, all_extracted_images)
+                finally:
+                    pages.close()
+                    shutil.rmtree(work_dir, ignore_errors=True)
 
             if self.is_cancelled:
                 self.error_signal.emit("Processing cancelled by user")
@@ -157,21 +237,20 @@ class PDFWorker(QThread):
             # Convert to requested format
             self.status_signal.emit(f"📝 Converting to {output_format}...")
             logger.info(f"Converting {len(pages_content)} pages to {output_format} format...")
-            converter = DocumentConverter()
 
             if output_format == 'markdown':
-                logger.debug("Converting to Markdown...")
-                content = converter.to_markdown(pages_content, include_images=False)
+                logger.debug("Finishing streamed Markdown...")
+                content = self._finish_stream()
                 content_type = 'text/markdown'
                 logger.info(f"Markdown conversion complete - {len(content)} characters")
             elif output_format == 'html':
-                logger.debug("Converting to HTML...")
-                content = converter.to_html(pages_content, include_images=False)
+                logger.debug("Finishing streamed HTML...")
+                content = self._finish_stream()
                 content_type = 'text/html'
                 logger.info(f"HTML conversion complete - {len(content)} characters")
             elif output_format == 'docx':
                 logger.debug("Converting to DOCX...")
-                docx_buffer = converter.to_docx(pages_content, include_images=False)
+                docx_buffer = DocumentConverter().to_docx(pages_content, include_images=False)
                 content = docx_buffer.getvalue()
                 content_type = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
                 logger.info(f"DOCX conversion complete - {len(content)} bytes")
@@ -200,186 +279,503 @@ class PDFWorker(QThread):
                 'extracted_images_count': len(all_extracted_images)
             }
 
-            logger.info("="*60)
+            logger.info(_SEP)
             logger.info(f"PDF processing complete!")
             logger.info(f"  Total pages: {total_pages}")
             logger.info(f"  Output format: {output_format}")
             logger.info(f"  Content size: {len(content) if isinstance(content, (str, bytes)) else 'N/A'}")
             logger.info(f"  Extracted images: {len(all_extracted_images)}")
-            logger.info("="*60)
+            logger.info(_SEP)
 
             self.status_signal.emit(f"✅ Processing complete! {total_pages} pages processed.")
             self.finished_signal.emit(result)
 
         except Exception as e:
-            import traceback
             error_msg = f"PDF processing error: {str(e)}\n{traceback.format_exc()}"
             logger.error(error_msg)
             self.error_signal.emit(error_msg)
 
-    def _process_page(self, img: Image.Image, page_num: int, **kwargs) -> Optional[Dict[str, Any]]:
-        """Process a single PDF page
+        finally:
+            self._postproc_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _rasterize(self, pdf_bytes: bytes, dpi: int, rasterized: queue.Queue):
+        """Producer: render PDF pages ahead of OCR (runs in a helper thread)
+
+        Args:
+            pdf_bytes: PDF file as bytes
+            dpi: Rendering resolution
+            rasterized: Queue receiving page images, then None when done (or the raised exception)
+        """
+        try:
+            for img in pdf_to_images_iter(pdf_bytes, dpi=dpi):
+                if not self._put_rasterized(rasterized, img):
+                    return
+        except Exception as e:
+            self._put_rasterized(rasterized, e)
+            return
+        self._put_rasterized(rasterized, None)
+
+    def _put_rasterized(self, rasterized: queue.Queue, item) -> bool:
+        """Put an item on the raster queue, giving up once the consumer has stopped
+
+        Returns:
+            True if the item was queued
+        """
+        while not self._raster_stop.is_set():
+            try:
+                rasterized.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _iter_rasterized_pages(self, pdf_bytes: bytes, dpi: int) -> Iterator[Image.Image]:
+        """Yield page images in order while a helper thread renders the next ones
+
+        Args:
+            pdf_bytes: PDF file as bytes
+            dpi: Rendering resolution
+
+        Yields:
+            PIL Image of each page
+        """
+        rasterized: queue.Queue = queue.Queue(maxsize=self.RASTER_QUEUE_SIZE)
+        self._raster_stop.clear()
+        producer = threading.Thread(
+            target=self._rasterize, args=(pdf_bytes, dpi, rasterized), name="dsocr_rasterize", daemon=True
+        )
+        producer.start()
+        try:
+            while True:
+                # Poll so a consumer waiting in another thread returns once stopped
+                try:
+                    item = rasterized.get(timeout=0.1)
+                except queue.Empty:
+                    if self._raster_stop.is_set():
+                        return
+                    continue
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Release the producer if it is blocked on a full queue
+            self._raster_stop.set()
+
+    def _begin_stream(self, output_format: str):
+        """Start incremental conversion if the output format supports it
+
+        Args:
+            output_format: Requested output format
+        """
+        self._stream_chunks = []
+        self._stream_pending = {}
+        self._stream_next_page = 1
+        if output_format not in DocumentConverter.STREAMABLE_FORMATS:
+            self._stream_converter = None
+            return
+
+        self._stream_converter = DocumentConverter()
+        self._emit_partial(self._stream_converter.begin(output_format, include_images=False))
+
+    def _stream_page(self, page_num: int, page_result: Optional[Dict[str, Any]]):
+        """Append a finished page to the streamed document
+
+        Pages may finish out of order (vLLM), so they are held back until every
+        earlier page has finished.
+
+        Args:
+            page_num: Page number (1-indexed)
+            page_result: Page result, or None if the page failed
+        """
+        if self._stream_converter is None:
+            return
+
+        self._stream_pending[page_num] = page_result
+        while self._stream_next_page in self._stream_pending:
+            ready = self._stream_pending.pop(self._stream_next_page)
+            self._stream_next_page += 1
+            if ready is not None:
+                self._emit_partial(self._stream_converter.append_page(ready))
+
+    def _finish_stream(self) -> str:
+        """Finish incremental conversion
+
+        Returns:
+            Complete document
+        """
+        self._emit_partial(self._stream_converter.finalize())
+        content = "".join(self._stream_chunks)
+        self._stream_converter = None
+        self._stream_chunks = []
+        return content
+
+    def _emit_partial(self, chunk: str):
+        """Record a document chunk and forward it to the GUI"""
+        if chunk:
+            self._stream_chunks.append(chunk)
+            if not self.is_cancelled:
+                self.partial_content_signal.emit(chunk)
+
+    def _emit_progress(self, done: int, total_pages: int, status: str):
+        """Emit page progress, throttled to about _MAX_PROGRESS_UPDATES updates per document
+
+        Args:
+            done: Pages started or finished so far
+            total_pages: Total number of pages
+            status: Status message template with {done} and {total} fields
+        """
+        step = max(1, total_pages // _MAX_PROGRESS_UPDATES)
+        if done % step and done not in (1, total_pages):
+            return
+        self.page_progress_signal.emit(done, total_pages)
+        self.status_signal.emit(status.format(done=done, total=total_pages))
+
+    def _process_page(self, img: Image.Image, page_num: int, prompt: str, work_dir: str,
+                      **kwargs) -> Optional[concurrent.futures.Future]:
+        """Process a single PDF page with the local model
+
+        vLLM pages go through _process_pages_vllm_batched instead.
 
         Args:
             img: PIL Image of the page
             page_num: Page number (1-indexed)
+            prompt: OCR prompt shared by all pages
+            work_dir: Worker-scoped scratch directory, reused for every page
             **kwargs: Processing parameters
 
         Returns:
-            Dictionary with page results, or None on error
+            Future resolving to the page result (post-processing runs in the
+            worker's pool), or None if inference failed
         """
-        out_dir = None
-        temp_img_path = None
-
         try:
-            logger.debug(f"Processing page {page_num}...")
-
-            # Save image to temporary BytesIO
-            img_buffer = io.BytesIO()
-            img.save(img_buffer, format='PNG')
-            img_buffer.seek(0)
+            logger.debug("Processing page %d...", page_num)
 
             # Get image dimensions
             img_width, img_height = img.size
-            logger.debug(f"Page {page_num} dimensions: {img_width}x{img_height}")
-
-            # Build prompt for plain OCR (PDF processing always uses plain OCR)
-            prompt = build_prompt(
-                mode='plain_ocr',
-                user_prompt='',
-                grounding=False,
-                find_term=None,
-                schema=None,
-                include_caption=kwargs.get('include_caption', False)
-            )
-            logger.debug(f"Page {page_num} prompt built (length: {len(prompt)})")
-
-            # Create temporary output directory for model inference (local mode only)
-            out_dir = tempfile.mkdtemp(prefix=f"dsocr_pdf_page{page_num}_")
-            logger.debug(f"Page {page_num} output directory: {out_dir}")
-
-            # Create temporary image file (cross-platform compatible)
-            # Use delete=False to keep file until we manually delete it
-            temp_img_file = tempfile.NamedTemporaryFile(
-                mode='wb',
-                suffix='.png',
-                prefix=f'pdf_page_{page_num}_',
-                delete=False
-            )
-            temp_img_path = temp_img_file.name
-            temp_img_file.close()  # Close the file handle so PIL can write to it
-
-            # Save image to temporary file
-            img.save(temp_img_path)
-            logger.debug(f"Page {page_num} saved to: {temp_img_path}")
+            logger.debug("Page %d dimensions: %dx%d", page_num, img_width, img_height)
 
             # Perform OCR inference
             logger.info(f"Page {page_num}: Running OCR inference...")
-            if self.is_vllm:
-                # vLLM mode: Call remote API
-                logger.debug(f"Page {page_num}: Using vLLM remote inference")
-                result_text = self.model.infer(
-                    prompt=prompt,
-                    image_file=temp_img_path,
-                    base_size=kwargs.get('base_size', 1024),
-                    image_size=kwargs.get('image_size', 640),
-                    crop_mode=kwargs.get('crop_mode', True),
-                )
-            else:
-                # Local mode: Use transformer model
-                logger.debug(f"Page {page_num}: Using local transformer model")
-                result_text = self.model.infer(
-                    self.tokenizer,
-                    prompt=prompt,
-                    image_file=temp_img_path,
-                    output_path=out_dir,
-                    base_size=kwargs.get('base_size', 1024),
-                    image_size=kwargs.get('image_size', 640),
-                    crop_mode=kwargs.get('crop_mode', True),
-                    save_results=False,
-                    test_compress=kwargs.get('test_compress', False),
-                    eval_mode=True
+            # The model only accepts a path, so every page overwrites one file
+            page_image_path = os.path.join(work_dir, "page.png")
+            # Lossless but lightly compressed: the file is read back immediately
+            img.save(page_image_path, format='PNG', compress_level=1)
+            # No autograd bookkeeping during inference; the hook aborts generation on cancel
+            import torch  # local model only; already loaded by ModelManager
+            with _local_inference_lock:
+                abort_hook = self.model.register_forward_pre_hook(
+                    self._make_abort_hook(threading.get_ident())
                 )
+                try:
+                    with torch.inference_mode():
+                        result_text = self.model.infer(
+                            self.tokenizer,
+                            prompt=prompt,
+                            image_file=page_image_path,
+                            output_path=work_dir,
+                            base_size=kwargs.get('base_size', 1024),
+                            image_size=kwargs.get('image_size', 640),
+                            crop_mode=kwargs.get('crop_mode', True),
+                            save_results=False,
+                            test_compress=kwargs.get('test_compress', False),
+                            eval_mode=True
+                        )
+                finally:
+                    abort_hook.remove()
             logger.info(f"Page {page_num}: OCR complete - text length: {len(result_text) if isinstance(result_text, str) else 'N/A'}")
 
             # Normalize response (same as ocr_processor.py)
-            if isinstance(result_text, str):
-                result_text = result_text.strip()
-            elif isinstance(result_text, dict) and "text" in result_text:
-                result_text = str(result_text["text"]).strip()
-            elif isinstance(result_text, (list, tuple)):
-                result_text = "\n".join(map(str, result_text)).strip()
-            else:
-                result_text = ""
+            result_text = normalize_model_output(result_text)
 
             # Fallback: check output file
             if not result_text:
-                mmd = os.path.join(out_dir, "result.mmd")
-                if os.path.exists(mmd):
-                    with open(mmd, "r", encoding="utf-8") as fh:
-                        result_text = fh.read().strip()
-            if not result_text:
-                result_text = "No text returned by model."
+                mmd = os.path.join(work_dir, "result.mmd")
+                # One stat covers both existence and emptiness
+                try:
+                    mmd_size = os.stat(mmd).st_size
+                except FileNotFoundError:
+                    mmd_size = 0
+                if mmd_size:
+                    with open(mmd, "rb") as fh:
+                        result_text = fh.read().decode("utf-8").strip()
+            return self._postproc_pool.submit(
+                self._postprocess_page, img, page_num, result_text, kwargs.get('extract_images', True)
+            )
+
+        except _InferenceCancelled:
+            logger.info(f"Page {page_num}: Inference aborted by cancel")
+            return None
+
+        except Exception as e:
+            error_msg = f"Error processing page {page_num}: {str(e)}\n{traceback.format_exc()}"
+            logger.error(error_msg)
+            # Don't emit error for individual pages, just skip
+            return None
+
+    def _collect_page(self, page_num: int, future: Optional[concurrent.futures.Future], total_pages: int,
+                      pages_content: List[Dict[str, Any]], all_extracted_images: List[Dict[str, Any]]):
+        """Wait for a local page's post-processing and record its result
+
+        Args:
+            page_num: Page number (1-indexed)
+            future: Post-processing future from _process_page, or None if inference failed
+            total_pages: Total number of pages
+            pages_content: Page results collected so far (appended to)
+            all_extracted_images: Extracted images collected so far (appended to)
+        """
+        page_result = None
+        if future is not None:
+            try:
+                page_result = future.result()
+            except Exception as e:
+                logger.error(f"Error post-processing page {page_num}: {type(e).__name__}: {e}")
+
+        self._stream_page(page_num, page_result)
+
+        if page_result is None:
+            logger.warning(f"Page {page_num} processing failed, skipping")
+            return  # Skip failed pages
+
+        logger.debug("Page %d: text length %d", page_num, len(page_result.get('text', '')))
+        pages_content.append(page_result)
+
+        # Collect extracted images
+        if 'extracted_images' in page_result:
+            img_count = len(page_result['extracted_images'])
+            logger.debug("Page %d: extracted %d images", page_num, img_count)
+            all_extracted_images.extend(page_result['extracted_images'])
+
+        # Emit page completion
+        self.page_complete_signal.emit(page_num, page_result)
+        log_pdf_page(logger, page_num, total_pages, "completed")
+
+    def _make_abort_hook(self, thread_id: int):
+        """Build a forward pre-hook that aborts this worker's generation on cancel
+
+        The hook sits on the shared model, so it only fires for forwards run by
+        the thread that registered it; other workers' inferences are unaffected.
+
+        Args:
+            thread_id: Ident of the thread running this worker's inference
+
+        Returns:
+            Hook callable for register_forward_pre_hook
+        """
+        def abort_if_cancelled(module, args):
+            if self.is_cancelled and threading.get_ident() == thread_id:
+                raise _InferenceCancelled()
+
+        return abort_if_cancelled
+
+    def _postprocess_page(self, img: Image.Image, page_num: int, result_text: str,
+                          extract_images: bool) -> Dict[str, Any]:
+        """Turn normalized model output for a page into a page result
+
+        Args:
+            img: PIL Image of the page
+            page_num: Page number (1-indexed)
+            result_text: Normalized model output
+            extract_images: Crop referenced images out of the page
+
+        Returns:
+            Dictionary with page results
+        """
+        img_width, img_height = img.size
+
+        if not result_text:
+            result_text = "No text returned by model."
 
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Page {page_num} raw text preview: {result_text[:200]}...")
 
-            # Parse bounding boxes (if any)
-            boxes = parse_detections(result_text, img_width, img_height)
-            logger.debug(f"Page {page_num}: Parsed {len(boxes)} bounding boxes")
+        tags = find_grounding_tags(result_text)
 
-            # Clean grounding tags from text
+        # Parse bounding boxes (if any)
+        boxes = parse_detections(result_text, img_width, img_height) if "det" in tags else []
+        logger.debug("Page %d: Parsed %d bounding boxes", page_num, len(boxes))
+
+        # Clean grounding tags from text
+        if "ref" in tags or "grounding" in tags:
             display_text = clean_grounding_text(result_text)
-            logger.debug(f"Page {page_num}: Text cleaned - length: {len(display_text)}")
+        else:
+            display_text = result_text.strip()
+        logger.debug("Page %d: Text cleaned - length: %d", page_num, len(display_text))
+
+        # Extract images if requested
+        extracted_images = []
+        if extract_images:
+            logger.debug("Page %d: Extracting images from refs...", page_num)
+            matches, image_refs, other_refs = extract_ref_patterns(result_text)
+            logger.debug("Page %d: Found %d image refs, %d other refs", page_num, len(image_refs), len(other_refs))
+
+            if image_refs:
+                cropped = crop_images_from_refs(img, matches)
+                extracted_images = cropped
+                logger.info(f"Page {page_num}: Extracted {len(extracted_images)} images")
+
+                # Clean markdown content
+                display_text = clean_markdown_content(display_text, image_refs, other_refs)
+                logger.debug("Page %d: Markdown content cleaned", page_num)
+
+        return {
+            'page_num': page_num,
+            'text': display_text,
+            'raw_text': result_text,
+            'boxes': boxes,
+            'extracted_images': extracted_images,
+            'image_dims': {'w': img_width, 'h': img_height}
+        }
+
+    async def _process_pages_vllm_batched(self, pages: Iterator[Image.Image], total_pages: int,
+                                          prompt: str, extract_images: bool,
+                                          base_size: int) -> Optional[Dict[int, Dict[str, Any]]]:
+        """Run OCR for all pages as concurrent vLLM requests
+
+        vLLM's scheduler batches the in-flight requests, so pages are processed
+        together instead of one round-trip at a time. Each page is submitted as
+        soon as it is rendered, sent as an in-memory JPEG downscaled close to
+        the model input size, and post-processed as its response arrives.
 
-            # Extract images if requested
-            extracted_images = []
-            if kwargs.get('extract_images', True):
-                logger.debug(f"Page {page_num}: Extracting images from refs...")
-                matches, image_refs, other_refs = extract_ref_patterns(result_text)
-                logger.debug(f"Page {page_num}: Found {len(image_refs)} image refs, {len(other_refs)} other refs")
+        Args:
+            pages: PIL Images of the pages, in page order
+            total_pages: Number of pages the iterator yields
+            prompt: OCR prompt shared by all pages
+            extract_images: Crop referenced images out of each page
+            base_size: Model base processing size, bounds the uploaded page size
 
-                if image_refs:
-                    cropped = crop_images_from_refs(img, matches)
-                    extracted_images = cropped
-                    logger.info(f"Page {page_num}: Extracted {len(extracted_images)} images")
+        Returns:
+            Dictionary of page_num -> page result (failed pages omitted), or None if cancelled
+        """
+        async def ocr_page(page_num: int, img: Image.Image):
+            try:
+                image_bytes = await asyncio.to_thread(self._encode_page_for_upload, img, base_size)
+                result_text = await self.model.ainfer(
+                    prompt=prompt, image_bytes=image_bytes, mime_type="image/jpeg"
+                )
+                return page_num, img, result_text, None
+            except Exception as e:
+                return page_num, img, None, e
+
+        done_queue: asyncio.Queue = asyncio.Queue()
+        tasks = []
+
+        async def submit_pages():
+            for page_num in range(1, total_pages + 1):
+                # Waiting on the renderer must not block the event loop
+                img = await asyncio.to_thread(self._next_page, pages)
+                if img is None or self.is_cancelled:
+                    break
+                task = asyncio.create_task(ocr_page(page_num, img))
+                task.add_done_callback(done_queue.put_nowait)
+                tasks.append(task)
+            logger.info(f"Submitted {len(tasks)} pages to vLLM concurrently")
+
+        submitter = asyncio.create_task(submit_pages())
+        submitter.add_done_callback(done_queue.put_nowait)
+
+        page_results = {}
+        expected = total_pages
+        completed = 0
+        try:
+            while completed < expected:
+                done = await done_queue.get()
+                if done is submitter:
+                    # Surface rendering errors, and stop waiting for pages never submitted
+                    done.result()
+                    expected = len(tasks)
+                    continue
 
-                    # Clean markdown content
-                    display_text = clean_markdown_content(display_text, image_refs, other_refs)
-                    logger.debug(f"Page {page_num}: Markdown content cleaned")
+                page_num, img, result_text, error = done.result()
+                completed += 1
 
-            result = {
-                'page_num': page_num,
-                'text': display_text,
-                'raw_text': result_text,
-                'boxes': boxes,
-                'extracted_images': extracted_images,
-                'image_dims': {'w': img_width, 'h': img_height}
-            }
+                if self.is_cancelled:
+                    return None
 
-            logger.debug(f"Page {page_num}: Processing complete")
-            return result
+                self._emit_progress(completed, total_pages, "🔍 Processed {done}/{total} pages...")
 
-        except Exception as e:
-            import traceback
-            error_msg = f"Error processing page {page_num}: {str(e)}\n{traceback.format_exc()}"
-            logger.error(error_msg)
-            # Don't emit error for individual pages, just skip
-            return None
-
-        finally:
-            # Cleanup temporary directory and image
-            if out_dir and os.path.exists(out_dir):
-                logger.debug(f"Page {page_num}: Cleaning up output directory: {out_dir}")
-                shutil.rmtree(out_dir, ignore_errors=True)
+                if error is not None:
+                    logger.error(f"Error processing page {page_num}: {type(error).__name__}: {error}")
+                    logger.warning(f"Page {page_num} processing failed, skipping")
+                    self._stream_page(page_num, None)
+                    continue
 
-            if temp_img_path and os.path.exists(temp_img_path):
                 try:
-                    logger.debug(f"Page {page_num}: Removing temporary image: {temp_img_path}")
-                    os.remove(temp_img_path)
+                    # Post-process in the worker's pool so the event loop keeps serving requests
+                    page_result = await asyncio.get_running_loop().run_in_executor(
+                        self._postproc_pool, self._postprocess_page,
+                        img, page_num, normalize_model_output(result_text), extract_images
+                    )
                 except Exception as e:
-                    # On Windows, files may be locked by other processes
-                    logger.warning(f"Page {page_num}: Failed to remove temp file: {e}")
-                    pass
+                    logger.error(f"Error post-processing page {page_num}: {type(e).__name__}: {e}")
+                    self._stream_page(page_num, None)
+                    continue
+
+                page_results[page_num] = page_result
+                self.page_complete_signal.emit(page_num, page_result)
+                self._stream_page(page_num, page_result)
+                log_pdf_page(logger, page_num, total_pages, "completed")
+
+            if self.is_cancelled:
+                return None
+        finally:
+            # Drop outstanding requests on cancel or error
+            self._raster_stop.set()
+            submitter.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(submitter, *tasks, return_exceptions=True)
+            # A renderer wait still running in a worker thread returns within one
+            # poll interval now that the raster stop is set
+            await asyncio.to_thread(self._close_pages, pages)
+
+        return page_results
+
+    def _next_page(self, pages: Iterator[Image.Image]) -> Optional[Image.Image]:
+        """Get the next rendered page, or None when there are no more
+
+        Args:
+            pages: Page iterator from _iter_rasterized_pages
+        """
+        with self._pages_lock:
+            return next(pages, None)
+
+    def _close_pages(self, pages: Iterator[Image.Image]):
+        """Close the page iterator once no thread is inside it
+
+        Args:
+            pages: Page iterator from _iter_rasterized_pages
+        """
+        with self._pages_lock:
+            pages.close()
+
+    UPLOAD_SIZE_FACTOR = 1.5  # Longest uploaded side relative to base_size
+    UPLOAD_JPEG_QUALITY = 92
+
+    @classmethod
+    def _encode_page_for_upload(cls, img: Image.Image, base_size: int) -> bytes:
+        """Encode a page image for the vLLM request
+
+        The server resizes to base_size anyway, so full-resolution pages only
+        inflate the payload. Boxes are normalized (0-999), so the original page
+        can still be used for cropping.
+
+        Args:
+            img: PIL Image of the page
+            base_size: Model base processing size
+
+        Returns:
+            JPEG-encoded bytes
+        """
+        width, height = img.size
+        scale = min(1.0, base_size * cls.UPLOAD_SIZE_FACTOR / max(width, height))
+        if scale < 1.0:
+            img = img.resize((int(width * scale), int(height * scale)), Image.LANCZOS)
+
+        buffer = io.BytesIO()
+        img.save(buffer, format='JPEG', quality=cls.UPLOAD_JPEG_QUALITY)
+        return buffer.getvalue()
 
 
 class PDFProcessor:
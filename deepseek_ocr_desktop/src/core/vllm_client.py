@@ -4,22 +4,200 @@ Uses OpenAI-compatible API to communicate with vLLM server
 Based on: https://docs.vllm.ai/projects/recipes/en/latest/DeepSeek/DeepSeek-OCR.html
 """
 
-import base64
-import time
-from typing import Optional
-from openai import OpenAI, APIConnectionError, APITimeoutError, RateLimitError
+import asyncio
+import hashlib
+import io
+import queue
+import random
+import threading
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+import httpx
+from PIL import Image
+from openai import OpenAI, AsyncOpenAI, APIConnectionError, APITimeoutError, RateLimitError
+
+try:
+    # Optional: SIMD base64 codec, several times faster on large images
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+from core import async_runtime
+from utils.logger import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Keep-alive pool shared by every client in the process, so pages and dialogs
+# don't pay a new TCP/TLS handshake each; sized for many concurrent in-flight requests
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+_http_lock = threading.Lock()
+_http_client: Optional[httpx.Client] = None
+_async_http_client: Optional[httpx.AsyncClient] = None
+_async_http_loop: Optional[asyncio.AbstractEventLoop] = None
+# Open VLLMClients using the shared pools; the last close() shuts them down
+_http_users = 0
+
+
+def _shared_http_client() -> httpx.Client:
+    """Get the process-wide synchronous connection pool, registering a new user
+
+    Every call must be balanced by _release_http_clients().
+    """
+    global _http_client, _http_users
+    with _http_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(limits=_HTTP_LIMITS, follow_redirects=True)
+        _http_users += 1
+        return _http_client
+
+
+def _release_http_clients():
+    """Unregister a pool user, closing both shared pools when none is left"""
+    global _http_client, _async_http_client, _async_http_loop, _http_users
+    with _http_lock:
+        _http_users -= 1
+        if _http_users > 0:
+            return
+        http_client, _http_client = _http_client, None
+        async_client, _async_http_client = _async_http_client, None
+        async_loop, _async_http_loop = _async_http_loop, None
+
+    if http_client is not None:
+        http_client.close()
+    if async_client is not None:
+        _aclose_on_loop(async_client, async_loop)
+
+
+def _aclose_on_loop(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop):
+    """Close an async pool on the loop its connections belong to, without waiting
+
+    Args:
+        client: Async connection pool to close
+        loop: Event loop the pool was used on
+    """
+    if loop.is_closed():
+        # Its transports died with the loop; nothing left to close cleanly
+        return
+    asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+def _shared_async_http_client(loop: asyncio.AbstractEventLoop) -> httpx.AsyncClient:
+    """Get the process-wide async connection pool for an event loop
+
+    httpx connections are tied to the loop that opened them, so the pool is
+    replaced if a different loop asks for it (normally only the async runtime's).
+
+    Args:
+        loop: Running event loop of the caller
+
+    Returns:
+        Async connection pool bound to loop
+    """
+    global _async_http_client, _async_http_loop
+    stale = None
+    with _http_lock:
+        if _async_http_client is None or _async_http_loop is not loop:
+            if _async_http_client is not None:
+                stale = (_async_http_client, _async_http_loop)
+            _async_http_client = httpx.AsyncClient(limits=_HTTP_LIMITS, follow_redirects=True)
+            _async_http_loop = loop
+        client = _async_http_client
+
+    if stale is not None:
+        # Release the old loop's keep-alive connections instead of leaking them
+        _aclose_on_loop(*stale)
+    return client
+
+# vLLM sampling options sent with every request (read-only, shared by all requests)
+_EXTRA_BODY = {
+    "skip_special_tokens": False,
+    "vllm_xargs": {
+        "ngram_size": 5,
+        "window_size": 10,
+        "whitelist_token_ids": [
+            32006,  # <|ref|>
+            32007,  # <|/ref|>
+            32008,  # <|det|>
+            32009,  # <|/det|>
+            32010,  # <|grounding|>
+        ],
+    },
+}
+
+# Leading magic bytes of the image formats the vLLM server decodes
+_IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF8", "image/gif"),
+    (b"BM", "image/bmp"),
+)
+
+
+def _sniff_mime_type(data: bytes) -> str:
+    """Detect an image's MIME type from its leading bytes
+
+    Args:
+        data: Encoded image (only the first 12 bytes are inspected)
+
+    Returns:
+        MIME type, "image/jpeg" when the format is not recognized
+    """
+    for signature, mime_type in _IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return mime_type
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/jpeg"
+
+
+# The server resizes to a 1024 global view plus at most a few 640 crop tiles,
+# so larger uploads only cost bandwidth and encode time; small files are sent untouched
+_UPLOAD_MAX_SIDE = 1920
+_UPLOAD_REENCODE_MIN_BYTES = 200 * 1024
+_UPLOAD_JPEG_QUALITY = 92
+
+
+def _shrink_for_upload(data: bytes) -> Optional[bytes]:
+    """Downscale an oversized image and re-encode it as JPEG
+
+    Args:
+        data: Encoded image
+
+    Returns:
+        JPEG bytes, or None when the image is already small enough
+    """
+    with Image.open(io.BytesIO(data)) as img:
+        if max(img.size) <= _UPLOAD_MAX_SIDE:
+            return None
+        img.draft("RGB", (_UPLOAD_MAX_SIDE, _UPLOAD_MAX_SIDE))  # JPEG: decode at reduced scale
+        img = img.convert("RGB")
+        img.thumbnail((_UPLOAD_MAX_SIDE, _UPLOAD_MAX_SIDE), Image.LANCZOS)
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=_UPLOAD_JPEG_QUALITY)
+        return buffer.getvalue()
 
 
 class VLLMClient:
     """Client for vLLM remote inference using OpenAI-compatible API"""
 
+    # Wait before retry n, in seconds; covers the settings dialog's 10 max retries
+    _NETWORK_BACKOFF = tuple(2 ** n for n in range(10))  # Exponential: 1s, 2s, 4s, ...
+    _RATE_LIMIT_BACKOFF = tuple(5 * (n + 1) for n in range(10))  # Linear: 5s, 10s, 15s, ...
+    _BACKOFF_JITTER = 0.25
+
+    # Finished results kept per client; output is deterministic (temperature 0)
+    _RESULT_CACHE_SIZE = 128
+
     def __init__(
         self,
         endpoint: str,
         api_key: Optional[str] = None,
         model_name: str = "deepseek-ai/DeepSeek-OCR",
         timeout: float = 300.0,  # 5 minutes default for OCR processing
-        max_retries: int = 3
+        max_retries: int = 3,
+        max_concurrency: int = 8
     ):
         """Initialize vLLM client
 
@@ -29,27 +207,44 @@ class VLLMClient:
             model_name: Model name to use (default: "deepseek-ai/DeepSeek-OCR")
             timeout: Request timeout in seconds (default: 300s for remote OCR processing)
             max_retries: Maximum number of retries for network errors (default: 3)
+            max_concurrency: Maximum in-flight async requests; match the server's
+                max_num_seqs (default: 8)
         """
         self.endpoint = endpoint
         self.model_name = model_name
         self.timeout = timeout
         self.max_retries = max_retries
+        self.api_key = api_key
+        self.max_concurrency = max_concurrency
+
+        # Async client and request slots are created lazily, bound to the event loop that uses them
+        self._async_client = None
+        self._async_loop = None
+        self._request_slots = None
+        self._closed = False
+
+        # (prompt, image digest) -> result text, least recently used first;
+        # only touched on the event loop thread
+        self._results: OrderedDict = OrderedDict()
 
         # Initialize OpenAI client with vLLM endpoint
         self.client = OpenAI(
             api_key=api_key or "EMPTY",  # vLLM doesn't require API key by default
             base_url=endpoint,
             timeout=timeout,  # Set timeout for all requests
-            max_retries=0  # Disable OpenAI client's automatic retry, we'll handle it ourselves
+            max_retries=0,  # Disable OpenAI client's automatic retry, we'll handle it ourselves
+            http_client=_shared_http_client()
         )
 
     def infer(
         self,
         prompt: str,
-        image_file: str,
+        image_file: Optional[str] = None,
         base_size: int = 1024,  # noqa: ARG002 - kept for API compatibility
         image_size: int = 640,  # noqa: ARG002 - kept for API compatibility
         crop_mode: bool = True,  # noqa: ARG002 - kept for API compatibility
+        image_bytes: Optional[bytes] = None,
+        mime_type: str = "image/png",
         **kwargs  # noqa: ARG002 - kept for API compatibility
     ) -> str:
         """Run OCR inference using vLLM endpoint
@@ -60,6 +255,8 @@ class VLLMClient:
             base_size: Base processing size (not used by vLLM, kept for compatibility)
             image_size: Image size parameter (not used by vLLM, kept for compatibility)
             crop_mode: Crop mode (not used by vLLM, kept for compatibility)
+            image_bytes: Encoded image, used instead of image_file when given
+            mime_type: MIME type of image_bytes
             **kwargs: Additional parameters (not used by vLLM, kept for compatibility)
 
         Returns:
@@ -70,12 +267,248 @@ class VLLMClient:
             for API compatibility with the local model interface but are not used
             by vLLM. The vLLM server handles all image processing internally.
         """
-        # Encode image to base64
-        with open(image_file, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode("utf-8")
+        # Shared event loop: concurrent callers' requests batch on the server
+        return async_runtime.run(
+            self.ainfer(prompt, image_file=image_file, image_bytes=image_bytes, mime_type=mime_type)
+        )
+
+    def infer_many(self, jobs: List[Tuple[str, str]], return_exceptions: bool = False) -> List[Any]:
+        """Run OCR on several images as concurrent requests
+
+        vLLM's scheduler batches the in-flight requests together.
+
+        Args:
+            jobs: (prompt, image_file) pairs
+            return_exceptions: Return a failed request's exception in its slot
+                instead of raising it
+
+        Returns:
+            OCR result texts (or exceptions), in job order
+        """
+        return async_runtime.run(self._gather(jobs, return_exceptions))
+
+    async def _gather(self, jobs: List[Tuple[str, str]], return_exceptions: bool) -> List[Any]:
+        """Await ainfer for every job concurrently"""
+        return await asyncio.gather(
+            *(self.ainfer(prompt, image_file=image_file) for prompt, image_file in jobs),
+            return_exceptions=return_exceptions
+        )
+
+    def infer_stream(
+        self,
+        prompt: str,
+        image_file: Optional[str] = None,
+        image_bytes: Optional[bytes] = None,
+        mime_type: str = "image/png"
+    ) -> Iterator[str]:
+        """Run OCR inference, yielding output text as it is generated
+
+        Closing the generator early cancels the request.
+
+        Args:
+            prompt: Text prompt for OCR
+            image_file: Path to image file
+            image_bytes: Encoded image, used instead of image_file when given
+            mime_type: MIME type of image_bytes
+
+        Yields:
+            Output text deltas
+        """
+        deltas: queue.Queue = queue.Queue()
+        done = object()
+
+        async def pump():
+            try:
+                async for delta in self.ainfer_stream(
+                    prompt, image_file=image_file, image_bytes=image_bytes, mime_type=mime_type
+                ):
+                    deltas.put(delta)
+            except BaseException as e:
+                deltas.put(e)
+                raise
+            deltas.put(done)
+
+        future = async_runtime.submit(pump())
+        try:
+            while True:
+                item = deltas.get()
+                if item is done:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            future.cancel()
+
+    async def ainfer_stream(
+        self,
+        prompt: str,
+        image_file: Optional[str] = None,
+        image_bytes: Optional[bytes] = None,
+        mime_type: str = "image/png"
+    ) -> AsyncIterator[str]:
+        """Run OCR inference, yielding output text as it is generated
+
+        Only opening the stream is retried; a stream that fails midway raises.
+
+        Args:
+            prompt: Text prompt for OCR
+            image_file: Path to image file
+            image_bytes: Encoded image, used instead of image_file when given
+            mime_type: MIME type of image_bytes
+
+        Yields:
+            Output text deltas
+        """
+        # Reading, hashing and encoding a large image must not stall the shared loop
+        data, mime_type, key = await asyncio.to_thread(self._read_image, prompt, image_file, image_bytes, mime_type)
+        cached = self._cached_result(key)
+        if cached is not None:
+            yield cached
+            return
+        request = await asyncio.to_thread(self._build_request, prompt, data, mime_type)
+
+        parts = []
+        client = self.async_client
+        for attempt in range(self.max_retries):
+            # The slot is held while streaming, but released during the backoff like in ainfer
+            async with self._request_slots:
+                try:
+                    stream = await client.chat.completions.create(**request, stream=True)
+                except (APIConnectionError, APITimeoutError, RateLimitError) as e:
+                    delay = self._retry_delay(e, attempt)
+                except Exception as e:
+                    raise RuntimeError(f"vLLM inference failed: {type(e).__name__}: {str(e)}") from e
+                else:
+                    async with stream:
+                        async for chunk in stream:
+                            if chunk.choices and chunk.choices[0].delta.content:
+                                parts.append(chunk.choices[0].delta.content)
+                                yield parts[-1]
+                    break
+            await asyncio.sleep(delay)
+        else:
+            raise RuntimeError(f"vLLM inference failed after {self.max_retries} attempts")
+
+        self._cache_result(key, "".join(parts))
+
+    async def ainfer(
+        self,
+        prompt: str,
+        image_file: Optional[str] = None,
+        image_bytes: Optional[bytes] = None,
+        mime_type: str = "image/png",
+        **kwargs  # noqa: ARG002 - kept for API compatibility
+    ) -> str:
+        """Run OCR inference using vLLM endpoint without blocking the event loop
+
+        Concurrent calls are batched by the vLLM server.
+
+        Args:
+            prompt: Text prompt for OCR
+            image_file: Path to image file
+            image_bytes: Encoded image, used instead of image_file when given
+            mime_type: MIME type of image_bytes
+            **kwargs: Additional parameters (not used by vLLM, kept for compatibility)
+
+        Returns:
+            OCR result text
+        """
+        # Reading, hashing and encoding a large image must not stall the shared loop
+        data, mime_type, key = await asyncio.to_thread(self._read_image, prompt, image_file, image_bytes, mime_type)
+        cached = self._cached_result(key)
+        if cached is not None:
+            return cached
+        request = await asyncio.to_thread(self._build_request, prompt, data, mime_type)
+
+        for attempt in range(self.max_retries):
+            try:
+                client = self.async_client
+                async with self._request_slots:
+                    response = await client.chat.completions.create(**request)
+                text = response.choices[0].message.content
+                self._cache_result(key, text)
+                return text
+
+            except (APIConnectionError, APITimeoutError, RateLimitError) as e:
+                await asyncio.sleep(self._retry_delay(e, attempt))
+
+            except Exception as e:
+                raise RuntimeError(f"vLLM inference failed: {type(e).__name__}: {str(e)}") from e
+
+        raise RuntimeError(f"vLLM inference failed after {self.max_retries} attempts")
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """AsyncOpenAI client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = AsyncOpenAI(
+                api_key=self.api_key or "EMPTY",
+                base_url=self.endpoint,
+                timeout=self.timeout,
+                max_retries=0,
+                http_client=_shared_async_http_client(loop)
+            )
+            self._request_slots = asyncio.Semaphore(self.max_concurrency)
+            self._async_loop = loop
+        return self._async_client
 
-        # Build image URL (data URI)
-        image_url = f"data:image/jpeg;base64,{image_data}"
+    def _read_image(self, prompt: str, image_file: Optional[str], image_bytes: Optional[bytes],
+                    mime_type: str) -> Tuple[bytes, str, Tuple[str, bytes]]:
+        """Load the image for a request and derive its result cache key
+
+        Args:
+            prompt: Text prompt for OCR
+            image_file: Path to image file
+            image_bytes: Encoded image, used instead of image_file when given
+            mime_type: MIME type of image_bytes
+
+        Returns:
+            Tuple of (encoded image, MIME type, cache key)
+        """
+        if image_bytes is not None:
+            data = image_bytes
+        else:
+            with open(image_file, "rb") as f:
+                data = f.read()
+            mime_type = _sniff_mime_type(data)
+        return data, mime_type, (prompt, hashlib.blake2b(data, digest_size=16).digest())
+
+    def _cached_result(self, key: Tuple[str, bytes]) -> Optional[str]:
+        """Look up a finished result, marking it recently used"""
+        text = self._results.get(key)
+        if text is not None:
+            self._results.move_to_end(key)
+            logger.debug("vLLM result cache hit")
+        return text
+
+    def _cache_result(self, key: Tuple[str, bytes], text: str):
+        """Store a finished result, evicting the least recently used one when full"""
+        self._results[key] = text
+        self._results.move_to_end(key)
+        if len(self._results) > self._RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
+
+    def _build_request(self, prompt: str, data: bytes, mime_type: str) -> Dict[str, Any]:
+        """Build chat completion arguments for an OCR request
+
+        Args:
+            prompt: Text prompt for OCR
+            data: Encoded image from _read_image
+            mime_type: MIME type of data
+
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        if len(data) > _UPLOAD_REENCODE_MIN_BYTES:
+            shrunk = _shrink_for_upload(data)
+            if shrunk is not None:
+                data, mime_type = shrunk, "image/jpeg"
+
+        # Encode image to base64 (data URI)
+        image_data = b64encode(data).decode("utf-8")
+        image_url = f"data:{mime_type};base64,{image_data}"
 
         # Build messages array
         # Remove <image> tag from prompt as we're adding it as separate content
@@ -91,68 +524,57 @@ class VLLMClient:
             }
         ]
 
-        # Call vLLM API with retry logic for network errors
-        last_error = None
-        for attempt in range(self.max_retries):
-            try:
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=messages,
-                    max_tokens=2048,
-                    temperature=0.0,
-                    extra_body={
-                        "skip_special_tokens": False,
-                        "vllm_xargs": {
-                            "ngram_size": 5,
-                            "window_size": 10,
-                            "whitelist_token_ids": [
-                                32006,  # <|ref|>
-                                32007,  # <|/ref|>
-                                32008,  # <|det|>
-                                32009,  # <|/det|>
-                                32010,  # <|grounding|>
-                            ],
-                        },
-                    },
-                )
-
-                # Extract text from response
-                result_text = response.choices[0].message.content
-                return result_text
-
-            except (APIConnectionError, APITimeoutError) as e:
-                # Network errors - retry with exponential backoff
-                last_error = e
-                if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    # Max retries reached
-                    raise RuntimeError(
-                        f"Failed to connect to vLLM server after {self.max_retries} attempts. "
-                        f"Last error: {type(e).__name__}: {str(e)}"
-                    ) from e
-
-            except RateLimitError as e:
-                # Rate limit error - retry with longer backoff
-                last_error = e
-                if attempt < self.max_retries - 1:
-                    wait_time = 5 * (attempt + 1)  # Linear backoff: 5s, 10s, 15s
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    raise RuntimeError(
-                        f"Rate limit exceeded after {self.max_retries} attempts. "
-                        f"Please try again later."
-                    ) from e
+        return {
+            "model": self.model_name,
+            "messages": messages,
+            "max_tokens": 2048,
+            "temperature": 0.0,
+            "extra_body": _EXTRA_BODY,
+        }
 
-            except Exception as e:
-                # Other errors - don't retry (likely model/prompt errors)
-                raise RuntimeError(f"vLLM inference failed: {type(e).__name__}: {str(e)}") from e
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Backoff before retrying a failed request
+
+        Args:
+            error: Network or rate limit error raised by the request
+            attempt: Zero-based attempt number
+
+        Returns:
+            Seconds to wait before the next attempt
+
+        Raises:
+            RuntimeError: When max retries are reached
+        """
+        if attempt >= self.max_retries - 1:
+            if isinstance(error, RateLimitError):
+                raise RuntimeError(
+                    f"Rate limit exceeded after {self.max_retries} attempts. "
+                    f"Please try again later."
+                ) from error
+            # Max retries reached
+            raise RuntimeError(
+                f"Failed to connect to vLLM server after {self.max_retries} attempts. "
+                f"Last error: {type(error).__name__}: {str(error)}"
+            ) from error
+
+        backoff = self._RATE_LIMIT_BACKOFF if isinstance(error, RateLimitError) else self._NETWORK_BACKOFF
+        # Jitter keeps concurrent requests that failed together from retrying in lockstep
+        return backoff[min(attempt, len(backoff) - 1)] + random.uniform(0, self._BACKOFF_JITTER)
 
-        # Should not reach here, but just in case
-        raise RuntimeError(f"vLLM inference failed after {self.max_retries} attempts") from last_error
+    def close(self):
+        """Release the client
+
+        The shared connection pools stay open while other clients use them, so
+        a connection test does not drop the main client's warm connections;
+        closing the last client shuts down both pools.
+        OpenAI.close() is not called because it would close the shared pool.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._async_client = None
+        self._async_loop = None
+        _release_http_clients()
 
     def test_connection(self) -> tuple[bool, str]:
         """Test connection to vLLM endpoint
@@ -5,6 +5,7 @@ Entry point for the PySide6 desktop GUI application
 
 import sys
 import os
+from pathlib import Path
 
 # PyInstaller 실행 파일 환경 감지 및 경로 설정
 def _setup_paths():
@@ -25,7 +26,7 @@ def _setup_paths():
 _setup_paths()
 
 from PySide6.QtWidgets import QApplication, QDialog
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QTimer
 
 # Import application components (절대 임포트 사용)
 from core.model_manager import ModelManager
@@ -53,19 +54,12 @@ def main():
     app.setOrganizationDomain("deepseek.ai")
     app_logger.info("Qt Application created")
 
-    # Enable high DPI scaling
-    app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
-    app_logger.debug("High DPI scaling enabled")
-
     # Load application stylesheet
-    import os
-    qss_path = os.path.join(os.path.dirname(__file__), "resources", "styles", "app.qss")
-    if os.path.exists(qss_path):
-        with open(qss_path, 'r', encoding='utf-8') as f:
-            app.setStyleSheet(f.read())
+    qss_path = Path(__file__).parent / "resources" / "styles" / "app.qss"
+    try:
+        app.setStyleSheet(qss_path.read_text(encoding='utf-8'))
         app_logger.info(f"Stylesheet loaded from: {qss_path}")
-    else:
+    except FileNotFoundError:
         app_logger.warning(f"Stylesheet not found: {qss_path}")
 
     # Load configuration
@@ -109,6 +103,7 @@ def main():
     vllm_api_key = config.get_vllm_api_key()
     vllm_timeout = config.get_vllm_timeout()
     vllm_max_retries = config.get_vllm_max_retries()
+    vllm_max_concurrency = config.get_vllm_max_concurrency()
 
     if use_vllm:
         app_logger.info(f"Configuration loaded - Mode: vLLM, Endpoint: {vllm_endpoint}, Model: {model_name}")
@@ -128,21 +123,26 @@ def main():
     model_manager.load_error_signal.connect(loading_dialog.show_error)
     app_logger.debug("Model manager signals connected")
 
-    # Reference to main window (will be created after model loads)
+    # Reference to main window (built hidden while the model loads)
     main_window = None
 
-    def on_model_loaded(model, tokenizer):
-        """Called when model is loaded successfully"""
+    def build_main_window():
+        """Create the main window if it does not exist yet"""
         nonlocal main_window
+        if main_window is None:
+            app_logger.info("Creating main window...")
+            main_window = MainWindow(model_manager, config)
 
+    def on_model_loaded(model, tokenizer):
+        """Called when model is loaded successfully"""
         app_logger.info("Model loaded successfully!")
 
         # Close loading dialog
         loading_dialog.model_loaded()
 
-        # Create and show main window
-        app_logger.info("Creating main window...")
-        main_window = MainWindow(model_manager, config)
+        # Show main window (built already unless loading beat it)
+        build_main_window()
+        main_window.set_model(model, tokenizer)
         main_window.show()
         app_logger.info("Main window displayed")
 
@@ -152,7 +152,8 @@ def main():
     # Start loading model or connecting to vLLM
     if use_vllm:
         app_logger.info(f"Connecting to vLLM endpoint: {vllm_endpoint}")
-        app_logger.debug(f"vLLM timeout: {vllm_timeout}s, max_retries: {vllm_max_retries}")
+        app_logger.debug(f"vLLM timeout: {vllm_timeout}s, max_retries: {vllm_max_retries}, "
+                         f"max_concurrency: {vllm_max_concurrency}")
         model_manager.load_model_async(
             model_name,
             hf_home,
@@ -160,11 +161,20 @@ def main():
             vllm_endpoint=vllm_endpoint,
             vllm_api_key=vllm_api_key,
             vllm_timeout=vllm_timeout,
-            vllm_max_retries=vllm_max_retries
+            vllm_max_retries=vllm_max_retries,
+            vllm_max_concurrency=vllm_max_concurrency
         )
     else:
         app_logger.info(f"Starting local model loading: {model_name}")
-        model_manager.load_model_async(model_name, hf_home)
+        model_manager.load_model_async(
+            model_name,
+            hf_home,
+            offload_layers=config.get_offload_layers(),
+            compile_model=config.get_compile_model()
+        )
+
+    # Build the main window inside the dialog's event loop, overlapping model loading
+    QTimer.singleShot(0, build_main_window)
 
     # Show loading dialog (blocks until model loads or error)
     app_logger.debug("Showing loading dialog...")
@@ -3,14 +3,41 @@ Settings Dialog
 Comprehensive settings dialog for all application settings
 """
 
+import os
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget,
     QWidget, QLabel, QLineEdit, QSpinBox, QCheckBox,
     QPushButton, QFormLayout, QGroupBox, QFileDialog,
-    QMessageBox, QSlider
+    QMessageBox, QSlider, QProgressDialog
 )
-from PySide6.QtCore import Qt, QSize, Signal
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QSize, Signal, QTimer
+
+# Resolved once: Qt and the model loader do not expand "~"
+_DEFAULT_HF_HOME = os.path.expanduser("~/.cache/huggingface")
+
+# Values applied by "Reset All"
+_DEFAULTS = {
+    "use_vllm": False,
+    "vllm_endpoint": "http://localhost:8000/v1",
+    "vllm_api_key": "",
+    "vllm_timeout": 300,
+    "vllm_max_retries": 3,
+    "model_name": "deepseek-ai/DeepSeek-OCR",
+    "hf_home": _DEFAULT_HF_HOME,
+    "offload_layers": False,
+    "compile_model": False,
+    "base_size": 1024,
+    "image_size": 640,
+    "crop_mode": True,
+    "test_compress": False,
+    "include_caption": False,
+    "pdf_dpi": 144,
+    "pdf_extract_images": True,
+    "font_size": 12,
+    "log_font_size": 11,
+    "ui_font_size": 12,
+}
 
 
 class SettingsDialog(QDialog):
@@ -34,8 +61,13 @@ class SettingsDialog(QDialog):
         self.original_log_font_size = config.get_log_font_size()
         self.original_ui_font_size = config.get_ui_font_size()
 
+        # Coalesces font changes during a slider drag into one window refresh
+        self._font_refresh_timer = QTimer(self)
+        self._font_refresh_timer.setSingleShot(True)
+        self._font_refresh_timer.setInterval(50)
+        self._font_refresh_timer.timeout.connect(self.fontSettingsChanged.emit)
+
         self.setup_ui()
-        self.load_settings()
 
     def setup_ui(self):
         """Setup dialog UI"""
@@ -46,32 +78,29 @@ class SettingsDialog(QDialog):
 
         # Title
         title = QLabel("⚙️ Application Settings")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title.setFont(title_font)
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("padding: 10px; color: #0ea5e9;")
+        title.setObjectName("settingsTitle")
         layout.addWidget(title)
 
-        # Tab widget
+        # Tab widget: each tab's contents are built (and loaded from config)
+        # the first time it is shown, so opening the dialog only builds one
         self.tab_widget = QTabWidget()
-
-        # Model settings tab
-        self.model_tab = self.create_model_tab()
-        self.tab_widget.addTab(self.model_tab, "🤖 Model")
-
-        # Processing settings tab
-        self.processing_tab = self.create_processing_tab()
-        self.tab_widget.addTab(self.processing_tab, "⚡ Processing")
-
-        # PDF settings tab
-        self.pdf_tab = self.create_pdf_tab()
-        self.tab_widget.addTab(self.pdf_tab, "📄 PDF")
-
-        # UI settings tab
-        self.ui_tab = self.create_ui_tab()
-        self.tab_widget.addTab(self.ui_tab, "🎨 Interface")
+        self._tabs = [
+            # (builder, load from config, save to config)
+            (self.create_model_tab, self._load_model_settings, self._save_model_settings),
+            (self.create_processing_tab, self._load_processing_settings, self._save_processing_settings),
+            (self.create_pdf_tab, self._load_pdf_settings, self._save_pdf_settings),
+            (self.create_ui_tab, self._load_ui_settings, self._save_ui_settings),
+        ]
+        self._built_tabs = set()
+
+        self.model_tab = self._add_tab_page("🤖 Model")
+        self.processing_tab = self._add_tab_page("⚡ Processing")
+        self.pdf_tab = self._add_tab_page("📄 PDF")
+        self.ui_tab = self._add_tab_page("🎨 Interface")
+
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
+        self._ensure_tab(self.tab_widget.currentIndex())
 
         layout.addWidget(self.tab_widget)
 
@@ -99,6 +128,40 @@ class SettingsDialog(QDialog):
 
         self.setLayout(layout)
 
+    def _add_tab_page(self, label: str) -> QWidget:
+        """Add an empty tab page that receives its contents on first show
+
+        Args:
+            label: Tab label
+
+        Returns:
+            Tab page widget
+        """
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        self.tab_widget.addTab(page, label)
+        return page
+
+    def _ensure_tab(self, index: int):
+        """Build a tab's contents and load its settings if not done yet
+
+        Args:
+            index: Tab index
+        """
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+
+        builder, load, _ = self._tabs[index]
+        self.tab_widget.widget(index).layout().addWidget(builder())
+        load()
+
+    def _ensure_all_tabs(self):
+        """Build every tab (needed before touching all widgets)"""
+        for index in range(len(self._tabs)):
+            self._ensure_tab(index)
+
     def create_model_tab(self) -> QWidget:
         """Create model settings tab
 
@@ -176,6 +239,18 @@ class SettingsDialog(QDialog):
 
         model_layout.addRow("HF Cache:", hf_home_row)
 
+        self.offload_layers_check = QCheckBox("Offload layers that do not fit in VRAM to CPU")
+        self.offload_layers_check.setToolTip(
+            "Lets GPUs with too little memory run the model (much slower, needs 'accelerate')"
+        )
+        model_layout.addRow("Memory:", self.offload_layers_check)
+
+        self.compile_model_check = QCheckBox("Compile model with torch.compile")
+        self.compile_model_check.setToolTip(
+            "Slower startup, possibly faster inference; falls back to eager mode on errors"
+        )
+        model_layout.addRow("Performance:", self.compile_model_check)
+
         self.model_group.setLayout(model_layout)
         layout.addWidget(self.model_group)
 
@@ -185,7 +260,7 @@ class SettingsDialog(QDialog):
             "Model will be downloaded on next startup if not cached (local mode only)."
         )
         info.setWordWrap(True)
-        info.setStyleSheet("color: #f59e0b; padding: 10px; background-color: rgba(245, 158, 11, 0.1); border-radius: 6px;")
+        info.setObjectName("restartNotice")
         layout.addWidget(info)
 
         layout.addStretch()
@@ -201,21 +276,16 @@ class SettingsDialog(QDialog):
         self.vllm_max_retries_spin.setEnabled(checked)
         self.test_connection_button.setEnabled(checked)
 
-        # Enable/disable local model fields
-        self.model_name_edit.setEnabled(not checked)
-        self.hf_home_edit.setEnabled(not checked)
+        # Enable/disable local model fields (the group disables its children)
         self.model_group.setEnabled(not checked)
 
     def test_vllm_connection(self):
         """Test connection to vLLM endpoint"""
-        from PySide6.QtWidgets import QProgressDialog
-        from PySide6.QtCore import QTimer
-
         # Get current values
         endpoint = self.vllm_endpoint_edit.text().strip()
         api_key = self.vllm_api_key_edit.text().strip()
         model_name = self.model_name_edit.text().strip() or "deepseek-ai/DeepSeek-OCR"
-        timeout = float(self.vllm_timeout_spin.value())
+        timeout = self.vllm_timeout_spin.value()
         max_retries = self.vllm_max_retries_spin.value()
 
         # Validate endpoint
@@ -236,9 +306,9 @@ class SettingsDialog(QDialog):
         progress.setMinimumDuration(0)
         progress.setValue(0)
 
-        # Import VLLMClient
+        # Import connection test worker
         try:
-            from core.vllm_client import VLLMClient
+            from core.model_manager import ConnectionTestWorker
         except ImportError as e:
             progress.close()
             QMessageBox.critical(
@@ -250,53 +320,44 @@ class SettingsDialog(QDialog):
             )
             return
 
-        # Test connection in a timer to avoid blocking UI
-        def do_test():
-            try:
-                # Create client
-                client = VLLMClient(
-                    endpoint=endpoint,
-                    api_key=api_key if api_key else None,
-                    model_name=model_name,
-                    timeout=timeout,
-                    max_retries=max_retries
-                )
+        def on_finished(success: bool, message: str):
+            # Close progress dialog
+            progress.close()
 
-                # Test connection
-                success, message = client.test_connection()
-
-                # Close progress dialog
-                progress.close()
-
-                # Show result
-                if success:
-                    QMessageBox.information(
-                        self,
-                        "Connection Successful",
-                        f"Successfully connected to vLLM endpoint!\n\n{message}"
-                    )
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Connection Failed",
-                        f"Failed to connect to vLLM endpoint:\n\n{message}\n\n"
-                        "Please check:\n"
-                        "• Endpoint URL is correct (must end with /v1)\n"
-                        "• vLLM server is running\n"
-                        "• Network connection is available\n"
-                        "• Firewall allows the connection"
-                    )
-
-            except Exception as e:
-                progress.close()
-                QMessageBox.critical(
+            # Show result
+            if success:
+                QMessageBox.information(
+                    self,
+                    "Connection Successful",
+                    f"Successfully connected to vLLM endpoint!\n\n{message}"
+                )
+            else:
+                QMessageBox.warning(
                     self,
-                    "Test Failed",
-                    f"Error testing connection:\n\n{type(e).__name__}: {str(e)}"
+                    "Connection Failed",
+                    f"Failed to connect to vLLM endpoint:\n\n{message}\n\n"
+                    "Please check:\n"
+                    "• Endpoint URL is correct (must end with /v1)\n"
+                    "• vLLM server is running\n"
+                    "• Network connection is available\n"
+                    "• Firewall allows the connection"
                 )
 
-        # Run test after a short delay to show progress dialog
-        QTimer.singleShot(100, do_test)
+        def on_error(error: str):
+            progress.close()
+            QMessageBox.critical(
+                self,
+                "Test Failed",
+                f"Error testing connection:\n\n{error}"
+            )
+
+        # Test connection in a worker thread so the UI stays responsive
+        self._connection_test_worker = ConnectionTestWorker(
+            endpoint, api_key, model_name, timeout, max_retries
+        )
+        self._connection_test_worker.finished_signal.connect(on_finished)
+        self._connection_test_worker.error_signal.connect(on_error)
+        self._connection_test_worker.start()
 
     def create_processing_tab(self) -> QWidget:
         """Create processing settings tab
@@ -403,71 +464,17 @@ class SettingsDialog(QDialog):
         font_group = QGroupBox("Font Size Settings")
         font_layout = QFormLayout()
 
-        # Result viewer font size
-        result_font_layout = QHBoxLayout()
-        self.font_size_spin = QSpinBox()
-        self.font_size_spin.setMinimum(8)
-        self.font_size_spin.setMaximum(24)
-        self.font_size_spin.setSingleStep(1)
-        self.font_size_spin.setSuffix(" pt")
-        self.font_size_spin.setToolTip("Font size for OCR result text (8-24pt)")
-        self.font_size_spin.valueChanged.connect(self.on_result_font_size_changed)
-        result_font_layout.addWidget(self.font_size_spin)
-
-        self.font_size_slider = QSlider(Qt.Horizontal)
-        self.font_size_slider.setMinimum(8)
-        self.font_size_slider.setMaximum(24)
-        self.font_size_slider.setTickPosition(QSlider.TicksBelow)
-        self.font_size_slider.setTickInterval(2)
-        self.font_size_slider.valueChanged.connect(self.font_size_spin.setValue)
-        self.font_size_spin.valueChanged.connect(self.font_size_slider.setValue)
-        result_font_layout.addWidget(self.font_size_slider)
-
-        font_layout.addRow("Result Text:", result_font_layout)
-
-        # Log viewer font size
-        log_font_layout = QHBoxLayout()
-        self.log_font_size_spin = QSpinBox()
-        self.log_font_size_spin.setMinimum(8)
-        self.log_font_size_spin.setMaximum(24)
-        self.log_font_size_spin.setSingleStep(1)
-        self.log_font_size_spin.setSuffix(" pt")
-        self.log_font_size_spin.setToolTip("Font size for log viewer (8-24pt)")
-        self.log_font_size_spin.valueChanged.connect(self.on_log_font_size_changed)
-        log_font_layout.addWidget(self.log_font_size_spin)
-
-        self.log_font_size_slider = QSlider(Qt.Horizontal)
-        self.log_font_size_slider.setMinimum(8)
-        self.log_font_size_slider.setMaximum(24)
-        self.log_font_size_slider.setTickPosition(QSlider.TicksBelow)
-        self.log_font_size_slider.setTickInterval(2)
-        self.log_font_size_slider.valueChanged.connect(self.log_font_size_spin.setValue)
-        self.log_font_size_spin.valueChanged.connect(self.log_font_size_slider.setValue)
-        log_font_layout.addWidget(self.log_font_size_slider)
-
-        font_layout.addRow("Log Viewer:", log_font_layout)
-
-        # UI font size (Control Panel, buttons, labels)
-        ui_font_layout = QHBoxLayout()
-        self.ui_font_size_spin = QSpinBox()
-        self.ui_font_size_spin.setMinimum(8)
-        self.ui_font_size_spin.setMaximum(24)
-        self.ui_font_size_spin.setSingleStep(1)
-        self.ui_font_size_spin.setSuffix(" pt")
-        self.ui_font_size_spin.setToolTip("Font size for Control Panel and UI elements (8-24pt)")
-        self.ui_font_size_spin.valueChanged.connect(self.on_ui_font_size_changed)
-        ui_font_layout.addWidget(self.ui_font_size_spin)
-
-        self.ui_font_size_slider = QSlider(Qt.Horizontal)
-        self.ui_font_size_slider.setMinimum(8)
-        self.ui_font_size_slider.setMaximum(24)
-        self.ui_font_size_slider.setTickPosition(QSlider.TicksBelow)
-        self.ui_font_size_slider.setTickInterval(2)
-        self.ui_font_size_slider.valueChanged.connect(self.ui_font_size_spin.setValue)
-        self.ui_font_size_spin.valueChanged.connect(self.ui_font_size_slider.setValue)
-        ui_font_layout.addWidget(self.ui_font_size_slider)
-
-        font_layout.addRow("Control Panel:", ui_font_layout)
+        # (label, attribute prefix, tooltip, change handler)
+        font_rows = (
+            ("Result Text:", "font_size", "Font size for OCR result text (8-24pt)",
+             self.on_result_font_size_changed),
+            ("Log Viewer:", "log_font_size", "Font size for log viewer (8-24pt)",
+             self.on_log_font_size_changed),
+            ("Control Panel:", "ui_font_size", "Font size for Control Panel and UI elements (8-24pt)",
+             self.on_ui_font_size_changed),
+        )
+        for label, name, tooltip, on_changed in font_rows:
+            font_layout.addRow(label, self._create_font_size_row(name, tooltip, on_changed))
 
         font_group.setLayout(font_layout)
         layout.addWidget(font_group)
@@ -512,29 +519,69 @@ class SettingsDialog(QDialog):
         tab.setLayout(layout)
         return tab
 
+    def _create_font_size_row(self, name: str, tooltip: str, on_changed) -> QHBoxLayout:
+        """Create a linked spin box and slider for one font size (8-24pt)
+
+        Stored as self.<name>_spin and self.<name>_slider.
+
+        Args:
+            name: Attribute prefix (e.g. "font_size")
+            tooltip: Spin box tooltip
+            on_changed: Slot called with the new size
+
+        Returns:
+            Row layout holding the spin box and slider
+        """
+        row = QHBoxLayout()
+
+        spin = QSpinBox()
+        spin.setRange(8, 24)
+        spin.setSuffix(" pt")
+        spin.setToolTip(tooltip)
+        spin.valueChanged.connect(on_changed)
+        row.addWidget(spin)
+
+        slider = QSlider(Qt.Horizontal)
+        slider.setRange(8, 24)
+        slider.valueChanged.connect(spin.setValue)
+        spin.valueChanged.connect(slider.setValue)
+        row.addWidget(slider)
+
+        setattr(self, f"{name}_spin", spin)
+        setattr(self, f"{name}_slider", slider)
+        return row
+
     def on_result_font_size_changed(self, size: int):
         """Handle result font size change - apply immediately"""
         self.config.set_font_size(size)
-        # Emit signal to notify parent window (no sync - will sync on save/cancel)
-        self.fontSettingsChanged.emit()
+        # Notify parent window once the value settles (no sync - will sync on save/cancel)
+        self._font_refresh_timer.start()
 
     def on_log_font_size_changed(self, size: int):
         """Handle log font size change - apply immediately"""
         self.config.set_log_font_size(size)
-        # Emit signal to notify parent window (no sync - will sync on save/cancel)
-        self.fontSettingsChanged.emit()
+        # Notify parent window once the value settles (no sync - will sync on save/cancel)
+        self._font_refresh_timer.start()
 
     def on_ui_font_size_changed(self, size: int):
         """Handle UI font size change - apply immediately"""
         self.config.set_ui_font_size(size)
-        # Emit signal to notify parent window (no sync - will sync on save/cancel)
-        self.fontSettingsChanged.emit()
+        # Notify parent window once the value settles (no sync - will sync on save/cancel)
+        self._font_refresh_timer.start()
 
     def load_settings(self):
-        """Load current settings from config"""
+        """Load current settings from config into every built tab"""
+        for index in sorted(self._built_tabs):
+            self._tabs[index][1]()
+
+    def _load_model_settings(self):
+        """Load model tab settings from config"""
         # vLLM settings
         use_vllm = self.config.get_use_vllm()
+        # The toggle handler runs once explicitly below, whether or not the state changes
+        self.use_vllm_check.blockSignals(True)
         self.use_vllm_check.setChecked(use_vllm)
+        self.use_vllm_check.blockSignals(False)
         self.vllm_endpoint_edit.setText(self.config.get_vllm_endpoint())
         self.vllm_api_key_edit.setText(self.config.get_vllm_api_key())
         self.vllm_timeout_spin.setValue(int(self.config.get_vllm_timeout()))
@@ -546,48 +593,60 @@ class SettingsDialog(QDialog):
         # Model settings
         self.model_name_edit.setText(self.config.get_model_name())
         self.hf_home_edit.setText(self.config.get_hf_home())
+        self.offload_layers_check.setChecked(self.config.get_offload_layers())
+        self.compile_model_check.setChecked(self.config.get_compile_model())
 
-        # Processing settings
+    def _load_processing_settings(self):
+        """Load processing tab settings from config"""
         self.base_size_spin.setValue(self.config.get_base_size())
         self.image_size_spin.setValue(self.config.get_image_size())
         self.crop_mode_check.setChecked(self.config.get_crop_mode())
         self.test_compress_check.setChecked(self.config.get_test_compress())
         self.include_caption_check.setChecked(self.config.get_include_caption())
 
-        # PDF settings
+    def _load_pdf_settings(self):
+        """Load PDF tab settings from config"""
         self.pdf_dpi_spin.setValue(self.config.get_pdf_dpi())
         self.extract_images_check.setChecked(self.config.get_pdf_extract_images())
 
-        # UI settings - Font sizes
-        font_size = self.config.get_font_size()
-        self.font_size_spin.setValue(font_size)
-        self.font_size_slider.setValue(font_size)
-
-        log_font_size = self.config.get_log_font_size()
-        self.log_font_size_spin.setValue(log_font_size)
-        self.log_font_size_slider.setValue(log_font_size)
-
-        ui_font_size = self.config.get_ui_font_size()
-        self.ui_font_size_spin.setValue(ui_font_size)
-        self.ui_font_size_slider.setValue(ui_font_size)
-
-        # UI settings - Window
+    def _load_ui_settings(self):
+        """Load interface tab settings from config"""
+        # Font sizes: the values already match config, so skip the valueChanged
+        # handlers that would write them back and refresh every window font
+        font_widgets = (
+            (self.font_size_spin, self.font_size_slider, self.config.get_font_size()),
+            (self.log_font_size_spin, self.log_font_size_slider, self.config.get_log_font_size()),
+            (self.ui_font_size_spin, self.ui_font_size_slider, self.config.get_ui_font_size()),
+        )
+        for spin, slider, size in font_widgets:
+            spin.blockSignals(True)
+            slider.blockSignals(True)
+            spin.setValue(size)
+            slider.setValue(size)
+            spin.blockSignals(False)
+            slider.blockSignals(False)
+
+        # Window
         self.restore_geometry_check.setChecked(True)  # Always enabled for now
         self.restore_splitter_check.setChecked(True)
 
-        # UI settings - Startup
+        # Startup
         self.skip_startup_dialog_check.setChecked(self.config.get_skip_startup_dialog())
 
     def browse_hf_home(self):
         """Browse for HuggingFace cache directory"""
-        directory = QFileDialog.getExistingDirectory(
+        # open() instead of getExistingDirectory(): the settings dialog keeps
+        # painting while the picker enumerates directories
+        dialog = QFileDialog(
             self,
             "Select HuggingFace Cache Directory",
-            self.hf_home_edit.text() or "~/.cache/huggingface"
+            self.hf_home_edit.text() or _DEFAULT_HF_HOME
         )
-
-        if directory:
-            self.hf_home_edit.setText(directory)
+        dialog.setFileMode(QFileDialog.Directory)
+        dialog.setOption(QFileDialog.ShowDirsOnly, True)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self.hf_home_edit.setText)
+        dialog.open()
 
     def clear_window_state(self):
         """Clear saved window state"""
@@ -602,9 +661,7 @@ class SettingsDialog(QDialog):
         )
 
         if reply == QMessageBox.Yes:
-            self.config.settings.remove("window/geometry")
-            self.config.settings.remove("window/state")
-            self.config.settings.remove("window/splitter_state")
+            self.config.clear_window_state()
             self.config.sync()
 
             QMessageBox.information(
@@ -613,37 +670,65 @@ class SettingsDialog(QDialog):
                 "Window state has been cleared!"
             )
 
-    def save_settings(self):
-        """Save settings to config"""
-        # vLLM settings
-        self.config.set_use_vllm(self.use_vllm_check.isChecked())
-        self.config.set_vllm_endpoint(self.vllm_endpoint_edit.text())
-        self.config.set_vllm_api_key(self.vllm_api_key_edit.text())
-        self.config.set_vllm_timeout(float(self.vllm_timeout_spin.value()))
-        self.config.set_vllm_max_retries(self.vllm_max_retries_spin.value())
-
-        # Model settings
-        self.config.set_model_name(self.model_name_edit.text())
-        self.config.set_hf_home(self.hf_home_edit.text())
+    def _save_fields(self, fields):
+        """Write the settings whose widget value differs from the stored one
 
-        # Processing settings
-        self.config.set_base_size(self.base_size_spin.value())
-        self.config.set_image_size(self.image_size_spin.value())
-        self.config.set_crop_mode(self.crop_mode_check.isChecked())
-        self.config.set_test_compress(self.test_compress_check.isChecked())
-        self.config.set_include_caption(self.include_caption_check.isChecked())
-
-        # PDF settings
-        self.config.set_pdf_dpi(self.pdf_dpi_spin.value())
-        self.config.set_pdf_extract_images(self.extract_images_check.isChecked())
+        Args:
+            fields: (widget value, config getter, config setter) tuples
+        """
+        for value, get, put in fields:
+            if value != get():
+                put(value)
 
-        # UI settings - Font sizes
-        self.config.set_font_size(self.font_size_spin.value())
-        self.config.set_log_font_size(self.log_font_size_spin.value())
-        self.config.set_ui_font_size(self.ui_font_size_spin.value())
+    def _save_model_settings(self):
+        """Save model tab settings to config"""
+        self._save_fields((
+            # vLLM settings
+            (self.use_vllm_check.isChecked(), self.config.get_use_vllm, self.config.set_use_vllm),
+            (self.vllm_endpoint_edit.text(), self.config.get_vllm_endpoint, self.config.set_vllm_endpoint),
+            (self.vllm_api_key_edit.text(), self.config.get_vllm_api_key, self.config.set_vllm_api_key),
+            (self.vllm_timeout_spin.value(), self.config.get_vllm_timeout, self.config.set_vllm_timeout),
+            (self.vllm_max_retries_spin.value(), self.config.get_vllm_max_retries, self.config.set_vllm_max_retries),
+            # Model settings
+            (self.model_name_edit.text(), self.config.get_model_name, self.config.set_model_name),
+            (self.hf_home_edit.text(), self.config.get_hf_home, self.config.set_hf_home),
+            (self.offload_layers_check.isChecked(), self.config.get_offload_layers, self.config.set_offload_layers),
+            (self.compile_model_check.isChecked(), self.config.get_compile_model, self.config.set_compile_model),
+        ))
+
+    def _save_processing_settings(self):
+        """Save processing tab settings to config"""
+        self._save_fields((
+            (self.base_size_spin.value(), self.config.get_base_size, self.config.set_base_size),
+            (self.image_size_spin.value(), self.config.get_image_size, self.config.set_image_size),
+            (self.crop_mode_check.isChecked(), self.config.get_crop_mode, self.config.set_crop_mode),
+            (self.test_compress_check.isChecked(), self.config.get_test_compress, self.config.set_test_compress),
+            (self.include_caption_check.isChecked(), self.config.get_include_caption, self.config.set_include_caption),
+        ))
+
+    def _save_pdf_settings(self):
+        """Save PDF tab settings to config"""
+        self._save_fields((
+            (self.pdf_dpi_spin.value(), self.config.get_pdf_dpi, self.config.set_pdf_dpi),
+            (self.extract_images_check.isChecked(), self.config.get_pdf_extract_images, self.config.set_pdf_extract_images),
+        ))
+
+    def _save_ui_settings(self):
+        """Save interface tab settings to config"""
+        self._save_fields((
+            # Font sizes
+            (self.font_size_spin.value(), self.config.get_font_size, self.config.set_font_size),
+            (self.log_font_size_spin.value(), self.config.get_log_font_size, self.config.set_log_font_size),
+            (self.ui_font_size_spin.value(), self.config.get_ui_font_size, self.config.set_ui_font_size),
+            # Startup
+            (self.skip_startup_dialog_check.isChecked(), self.config.get_skip_startup_dialog, self.config.set_skip_startup_dialog),
+        ))
 
-        # UI settings - Startup
-        self.config.set_skip_startup_dialog(self.skip_startup_dialog_check.isChecked())
+    def save_settings(self):
+        """Save settings to config"""
+        # Tabs never opened still hold the stored values, so only built tabs are saved
+        for index in sorted(self._built_tabs):
+            self._tabs[index][2]()
 
         # Sync to disk
         self.config.sync()
@@ -673,10 +758,47 @@ class SettingsDialog(QDialog):
         self.config.sync()  # Persist reverted values
         
         # Emit signal to refresh UI to original state
+        self._font_refresh_timer.stop()
         self.fontSettingsChanged.emit()
 
         self.reject()
 
+    def _apply_values(self, values: dict):
+        """Put setting values into the dialog's widgets (not saved until Save)
+
+        Args:
+            values: Setting name to value, keyed like _DEFAULTS
+        """
+        # The toggle handler runs once explicitly below, as in _load_model_settings
+        self.use_vllm_check.blockSignals(True)
+        self.use_vllm_check.setChecked(values["use_vllm"])
+        self.use_vllm_check.blockSignals(False)
+        self.vllm_endpoint_edit.setText(values["vllm_endpoint"])
+        self.vllm_api_key_edit.setText(values["vllm_api_key"])
+        self.vllm_timeout_spin.setValue(values["vllm_timeout"])
+        self.vllm_max_retries_spin.setValue(values["vllm_max_retries"])
+        self.on_use_vllm_toggled(values["use_vllm"])
+
+        self.model_name_edit.setText(values["model_name"])
+        self.hf_home_edit.setText(values["hf_home"])
+        self.offload_layers_check.setChecked(values["offload_layers"])
+        self.compile_model_check.setChecked(values["compile_model"])
+
+        self.base_size_spin.setValue(values["base_size"])
+        self.image_size_spin.setValue(values["image_size"])
+        self.crop_mode_check.setChecked(values["crop_mode"])
+        self.test_compress_check.setChecked(values["test_compress"])
+        self.include_caption_check.setChecked(values["include_caption"])
+
+        self.pdf_dpi_spin.setValue(values["pdf_dpi"])
+        self.extract_images_check.setChecked(values["pdf_extract_images"])
+
+        # Sliders follow their spin boxes; the font handlers stay connected so the
+        # window previews the defaults, and their debounce makes that one refresh
+        self.font_size_spin.setValue(values["font_size"])
+        self.log_font_size_spin.setValue(values["log_font_size"])
+        self.ui_font_size_spin.setValue(values["ui_font_size"])
+
     def reset_all(self):
         """Reset all settings to defaults"""
         reply = QMessageBox.warning(
@@ -690,37 +812,10 @@ class SettingsDialog(QDialog):
         )
 
         if reply == QMessageBox.Yes:
-            # Reset to defaults
-            # vLLM settings
-            self.use_vllm_check.setChecked(False)
-            self.vllm_endpoint_edit.setText("http://localhost:8000/v1")
-            self.vllm_api_key_edit.setText("")
-            self.vllm_timeout_spin.setValue(300)
-            self.vllm_max_retries_spin.setValue(3)
-            self.on_use_vllm_toggled(False)
+            # Every tab's widgets must exist to receive the defaults
+            self._ensure_all_tabs()
 
-            # Model settings
-            self.model_name_edit.setText("deepseek-ai/DeepSeek-OCR")
-            self.hf_home_edit.setText("~/.cache/huggingface")
-
-            # Processing settings
-            self.base_size_spin.setValue(1024)
-            self.image_size_spin.setValue(640)
-            self.crop_mode_check.setChecked(True)
-            self.test_compress_check.setChecked(False)
-            self.include_caption_check.setChecked(False)
-
-            # PDF settings
-            self.pdf_dpi_spin.setValue(144)
-            self.extract_images_check.setChecked(True)
-
-            # Reset font sizes to defaults
-            self.font_size_spin.setValue(12)
-            self.font_size_slider.setValue(12)
-            self.log_font_size_spin.setValue(11)
-            self.log_font_size_slider.setValue(11)
-            self.ui_font_size_spin.setValue(12)
-            self.ui_font_size_slider.setValue(12)
+            self._apply_values(_DEFAULTS)
 
             QMessageBox.information(
                 self,
@@ -3,6 +3,8 @@ Main Window for DeepSeek OCR Desktop Application
 QSplitter-based layout with left control panel and right result viewer
 """
 
+import os
+
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QLabel, QStatusBar, QMenuBar, QMenu, QPushButton,
@@ -38,7 +40,8 @@ class MainWindow(QMainWindow):
         """Initialize main window
 
         Args:
-            model_manager: ModelManager instance with loaded model
+            model_manager: ModelManager instance (the model may still be loading;
+                see set_model)
             config: AppConfig instance for settings
         """
         super().__init__()
@@ -71,6 +74,18 @@ class MainWindow(QMainWindow):
         self.setup_logging()
         self.restore_geometry()
 
+    def set_model(self, model, tokenizer):
+        """Use a model that finished loading after the window was built
+
+        Args:
+            model: DeepSeek-OCR model or VLLMClient
+            tokenizer: Model tokenizer (None in vLLM mode)
+        """
+        self.ocr_processor.model = model
+        self.ocr_processor.tokenizer = tokenizer
+        self.pdf_processor.model = model
+        self.pdf_processor.tokenizer = tokenizer
+
     def setup_ui(self):
         """Setup main window UI"""
         self.setWindowTitle("DeepSeek-OCR Desktop")
@@ -274,6 +289,13 @@ class MainWindow(QMainWindow):
         open_action.triggered.connect(self.open_file)
         file_menu.addAction(open_action)
 
+        # Batch OCR action
+        batch_action = QAction("&Batch OCR Images...", self)
+        batch_action.setShortcut("Ctrl+Shift+O")
+        batch_action.setStatusTip("Run OCR on several images with the current mode")
+        batch_action.triggered.connect(self.open_batch)
+        file_menu.addAction(batch_action)
+
         file_menu.addSeparator()
 
         # Exit action
@@ -406,7 +428,6 @@ class MainWindow(QMainWindow):
     def check_vllm_connection(self):
         """Check vLLM connection health"""
         from PySide6.QtWidgets import QMessageBox, QProgressDialog
-        from PySide6.QtCore import QTimer
 
         # Check if vLLM is enabled
         use_vllm = self.config.get_use_vllm()
@@ -441,9 +462,9 @@ class MainWindow(QMainWindow):
         progress.setMinimumDuration(0)
         progress.setValue(0)
 
-        # Import VLLMClient
+        # Import connection test worker
         try:
-            from core.vllm_client import VLLMClient
+            from core.model_manager import ConnectionTestWorker
         except ImportError as e:
             progress.close()
             QMessageBox.critical(
@@ -455,60 +476,51 @@ class MainWindow(QMainWindow):
             )
             return
 
-        # Test connection
-        def do_test():
-            try:
-                # Create client
-                client = VLLMClient(
-                    endpoint=endpoint,
-                    api_key=api_key if api_key else None,
-                    model_name=model_name,
-                    timeout=timeout,
-                    max_retries=max_retries
-                )
+        def on_finished(success: bool, message: str):
+            # Close progress dialog
+            progress.close()
 
-                # Test connection
-                success, message = client.test_connection()
-
-                # Close progress dialog
-                progress.close()
-
-                # Show result
-                if success:
-                    QMessageBox.information(
-                        self,
-                        "Connection Healthy",
-                        f"✅ vLLM connection is healthy!\n\n"
-                        f"{message}\n\n"
-                        f"Endpoint: {endpoint}\n"
-                        f"Model: {model_name}"
-                    )
-                    self.status_bar.showMessage("✅ vLLM connection healthy")
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Connection Unhealthy",
-                        f"❌ vLLM connection failed:\n\n{message}\n\n"
-                        f"Endpoint: {endpoint}\n\n"
-                        "Please check:\n"
-                        "• vLLM server is running\n"
-                        "• Endpoint URL is correct\n"
-                        "• Network connection is available\n"
-                        "• Firewall allows the connection"
-                    )
-                    self.status_bar.showMessage("❌ vLLM connection failed")
-
-            except Exception as e:
-                progress.close()
-                QMessageBox.critical(
+            # Show result
+            if success:
+                QMessageBox.information(
                     self,
-                    "Health Check Failed",
-                    f"Error checking connection:\n\n{type(e).__name__}: {str(e)}"
+                    "Connection Healthy",
+                    f"✅ vLLM connection is healthy!\n\n"
+                    f"{message}\n\n"
+                    f"Endpoint: {endpoint}\n"
+                    f"Model: {model_name}"
                 )
-                self.status_bar.showMessage("❌ Health check error")
+                self.status_bar.showMessage("✅ vLLM connection healthy")
+            else:
+                QMessageBox.warning(
+                    self,
+                    "Connection Unhealthy",
+                    f"❌ vLLM connection failed:\n\n{message}\n\n"
+                    f"Endpoint: {endpoint}\n\n"
+                    "Please check:\n"
+                    "• vLLM server is running\n"
+                    "• Endpoint URL is correct\n"
+                    "• Network connection is available\n"
+                    "• Firewall allows the connection"
+                )
+                self.status_bar.showMessage("❌ vLLM connection failed")
 
-        # Run test after a short delay
-        QTimer.singleShot(100, do_test)
+        def on_error(error: str):
+            progress.close()
+            QMessageBox.critical(
+                self,
+                "Health Check Failed",
+                f"Error checking connection:\n\n{error}"
+            )
+            self.status_bar.showMessage("❌ Health check error")
+
+        # Test connection in a worker thread so the UI stays responsive
+        self._connection_test_worker = ConnectionTestWorker(
+            endpoint, api_key, model_name, timeout, max_retries
+        )
+        self._connection_test_worker.finished_signal.connect(on_finished)
+        self._connection_test_worker.error_signal.connect(on_error)
+        self._connection_test_worker.start()
 
     def show_about(self):
         """Show about dialog"""
@@ -638,8 +650,50 @@ class MainWindow(QMainWindow):
         self.result_viewer.show_loading()
         self.status_bar.showMessage("🔍 Running OCR inference...")
 
-        # Collect parameters
-        params = {
+        # Create and start OCR worker
+        worker = self.ocr_processor.process_image(self.current_file, self._collect_image_params())
+
+        # Connect worker signals
+        worker.progress_signal.connect(self.on_ocr_progress)
+        worker.result_signal.connect(self.on_ocr_result)
+        worker.partial_result_signal.connect(self.on_partial_result)
+        worker.error_signal.connect(self.on_ocr_error)
+
+        # Start processing
+        worker.start()
+
+    def start_batch_processing(self, image_paths: list):
+        """Start OCR over several images in one worker
+
+        Args:
+            image_paths: Paths to image files, processed in order
+        """
+        # Disable button during processing
+        self.analyze_button.setEnabled(False)
+        self.analyze_button.setText("⏳ Processing...")
+
+        # Show loading state
+        self.result_viewer.show_loading()
+        self.status_bar.showMessage(f"🔍 Running OCR on {len(image_paths)} images...")
+
+        # Create and start batch worker
+        worker = self.ocr_processor.process_batch(image_paths, self._collect_image_params())
+
+        # Connect worker signals
+        worker.progress_signal.connect(self.on_ocr_progress)
+        worker.batch_finished_signal.connect(self.on_batch_result)
+        worker.error_signal.connect(self.on_ocr_error)
+
+        # Start processing
+        worker.start()
+
+    def _collect_image_params(self) -> dict:
+        """Collect image OCR parameters from the current mode and settings
+
+        Returns:
+            Processing parameters dict for OCRWorker / OCRBatchWorker
+        """
+        return {
             'mode': self.current_mode,
             'prompt': self.custom_prompt if self.current_mode == 'freeform' else '',
             'grounding': self.mode_selector.has_grounding(),
@@ -652,17 +706,6 @@ class MainWindow(QMainWindow):
             'test_compress': self.config.get_test_compress(),
         }
 
-        # Create and start OCR worker
-        worker = self.ocr_processor.process_image(self.current_file, params)
-
-        # Connect worker signals
-        worker.progress_signal.connect(self.on_ocr_progress)
-        worker.result_signal.connect(self.on_ocr_result)
-        worker.error_signal.connect(self.on_ocr_error)
-
-        # Start processing
-        worker.start()
-
     def start_pdf_processing(self):
         """Start PDF processing"""
         # Disable button, show cancel button
@@ -698,10 +741,24 @@ class MainWindow(QMainWindow):
         worker.finished_signal.connect(self.on_pdf_finished)
         worker.error_signal.connect(self.on_pdf_error)
         worker.status_signal.connect(self.on_pdf_status)
+        worker.partial_content_signal.connect(self.on_partial_result)
 
         # Start processing
         worker.start()
 
+    def on_partial_result(self, chunk: str):
+        """Handle streamed output from an OCR or PDF worker
+
+        Chunks still queued from a cancelled worker are dropped.
+
+        Args:
+            chunk: Next part of the streamed text
+        """
+        worker = self.sender()
+        if worker is not None and worker.is_cancelled:
+            return
+        self.result_viewer.append_streamed_text(chunk)
+
     def on_ocr_progress(self, message: str):
         """Handle OCR progress update
 
@@ -730,6 +787,36 @@ class MainWindow(QMainWindow):
             f"✅ OCR complete! Extracted {text_length} characters, {boxes_count} bounding boxes"
         )
 
+    def on_batch_result(self, results: list):
+        """Handle batch OCR completion
+
+        Args:
+            results: Per-image result dicts in input order (None for failed images)
+        """
+        # One section per image, like the per-page sections of a PDF
+        sections = []
+        for image_path, result in zip(self.sender().image_paths, results):
+            text = result['text'] if result is not None else "❌ OCR failed for this image"
+            sections.append(f"## {os.path.basename(image_path)}\n\n{text}")
+        content = "\n\n".join(sections)
+
+        done = sum(result is not None for result in results)
+        self.result_viewer.display_result({
+            'text': content,
+            'raw_text': content,
+            'boxes': [],
+            'metadata': {
+                'total_images': len(results),
+                'processed_images': done
+            }
+        })
+
+        # Re-enable button
+        self.analyze_button.setEnabled(True)
+        self.analyze_button.setText("🔍 Analyze Image")
+
+        self.status_bar.showMessage(f"✅ Batch OCR complete! {done}/{len(results)} images processed")
+
     def on_ocr_error(self, error_message: str):
         """Handle OCR error
 
@@ -881,6 +968,20 @@ class MainWindow(QMainWindow):
         if file_path:
             self.image_upload.load_file(file_path)
 
+    def open_batch(self):
+        """Handle Batch OCR menu action"""
+        from PySide6.QtWidgets import QFileDialog
+
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Batch OCR Images",
+            "",
+            "Image Files (*.png *.jpg *.jpeg *.webp *.gif *.bmp);;All Files (*)"
+        )
+
+        if file_paths:
+            self.start_batch_processing(file_paths)
+
     def copy_result(self):
         """Handle Copy menu action"""
         # Delegate to result viewer's copy function
@@ -11,7 +11,7 @@ from PySide6.QtWidgets import (
     QTextEdit, QLabel, QPushButton, QMessageBox, QFileDialog
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QTextOption
+from PySide6.QtGui import QFont, QTextCursor, QTextOption
 
 # Import bounding box canvas
 from ui.widgets.bounding_box_canvas import ImageWithBoxesWidget
@@ -33,6 +33,7 @@ class ResultViewerWidget(QWidget):
         self.current_result = None
         self.current_image_path = None
         self._font_size = 12  # Default font size
+        self._streaming = False  # Text area currently shows a document still being produced
         self.setup_ui()
 
     def setup_ui(self):
@@ -194,6 +195,7 @@ class ResultViewerWidget(QWidget):
         """
         self.current_result = result
         self.current_image_path = image_path
+        self._streaming = False
 
         # Display text
         text = result.get('text', '')
@@ -267,6 +269,21 @@ class ResultViewerWidget(QWidget):
             # Plain text mode
             self.result_text_edit.setPlainText(text)
 
+    def append_streamed_text(self, chunk: str):
+        """Append a chunk of a document that is still being produced
+
+        Chunks are shown as plain text; display_result renders the finished document.
+
+        Args:
+            chunk: Next part of the document
+        """
+        if not self._streaming:
+            self.result_text_edit.clear()
+            self._streaming = True
+        cursor = self.result_text_edit.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(chunk)
+
     def is_html(self, text: str) -> bool:
         """Check if text appears to be HTML
 
@@ -352,6 +369,7 @@ class ResultViewerWidget(QWidget):
         """Clear all displays"""
         self.current_result = None
         self.current_image_path = None
+        self._streaming = False
         self.result_text_edit.clear()
         self.raw_text_edit.clear()
         self.metadata_text_edit.clear()
@@ -363,6 +381,7 @@ class ResultViewerWidget(QWidget):
 
     def show_loading(self):
         """Show loading state"""
+        self._streaming = False
         self.result_text_edit.setPlainText("⏳ Processing your image...\n\nThis may take 10-30 seconds.")
         self.tab_widget.setCurrentIndex(0)  # Switch to text tab
 
@@ -372,6 +391,7 @@ class ResultViewerWidget(QWidget):
         Args:
             error_message: Error message to display
         """
+        self._streaming = False
         self.result_text_edit.setPlainText(f"❌ Error:\n\n{error_message}")
         self.copy_button.setEnabled(False)
         self.download_button.setEnabled(False)
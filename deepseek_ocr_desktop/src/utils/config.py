@@ -38,6 +38,22 @@ class AppConfig:
         """Set HuggingFace cache directory"""
         self.settings.setValue("model/hf_home", path)
 
+    def get_offload_layers(self) -> bool:
+        """Get whether to offload model layers that do not fit in VRAM to CPU"""
+        return self.settings.value("model/offload_layers", False, type=bool)
+
+    def set_offload_layers(self, enabled: bool):
+        """Set whether to offload model layers to CPU"""
+        self.settings.setValue("model/offload_layers", enabled)
+
+    def get_compile_model(self) -> bool:
+        """Get whether to compile the local model with torch.compile (default: off)"""
+        return self.settings.value("model/compile", False, type=bool)
+
+    def set_compile_model(self, enabled: bool):
+        """Set whether to compile the local model with torch.compile"""
+        self.settings.setValue("model/compile", enabled)
+
     # vLLM Configuration
     def get_use_vllm(self) -> bool:
         """Get whether to use vLLM remote endpoint instead of local model"""
@@ -79,6 +95,14 @@ class AppConfig:
         """Set maximum retry attempts for network errors"""
         self.settings.setValue("vllm/max_retries", max_retries)
 
+    def get_vllm_max_concurrency(self) -> int:
+        """Get maximum number of in-flight vLLM requests (default: 8)"""
+        return self.settings.value("vllm/max_concurrency", 8, type=int)
+
+    def set_vllm_max_concurrency(self, max_concurrency: int):
+        """Set maximum number of in-flight vLLM requests"""
+        self.settings.setValue("vllm/max_concurrency", max_concurrency)
+
     # Processing Configuration
     def get_base_size(self) -> int:
         """Get base processing size"""
@@ -163,6 +187,11 @@ class AppConfig:
         """Save splitter state"""
         self.settings.setValue("ui/splitter_state", state)
 
+    def clear_window_state(self):
+        """Remove saved window geometry, window state and splitter state"""
+        for key in ("ui/window_geometry", "ui/window_state", "ui/splitter_state"):
+            self.settings.remove(key)
+
     # Font Size Configuration
     def get_font_size(self) -> int:
         """Get application font size for result viewer"""
@@ -17,56 +17,10 @@ from PIL import Image
 class DocumentConverter:
     """Handles conversion of OCR results to various document formats"""
 
-    def __init__(self):
-        self.page_separator = '<--- Page Split --->'
-
-    def to_markdown(self, pages_content: List[Dict[str, Any]], include_images: bool = True) -> str:
-        """
-        Convert OCR results to Markdown format
-
-        Args:
-            pages_content: List of page dictionaries with text and metadata
-            include_images: Whether to include image references
-
-        Returns:
-            Markdown formatted string
-        """
-        md_content = []
-
-        for idx, page in enumerate(pages_content):
-            # Add page header
-            md_content.append(f"# Page {idx + 1}\n")
-
-            text = page.get('text', '')
-
-            # Process and clean the text
-            if include_images and 'images' in page:
-                # Replace image placeholders with actual markdown image syntax
-                for img_idx, img_data in enumerate(page.get('images', [])):
-                    placeholder = f"[IMAGE_{img_idx}]"
-                    img_ref = f"![Image {img_idx + 1}](data:image/jpeg;base64,{img_data})"
-                    text = text.replace(placeholder, img_ref)
-
-            md_content.append(text)
-            md_content.append("\n\n---\n\n")  # Page separator
-
-        return "\n".join(md_content)
+    # Formats that can be built page by page with begin()/append_page()/finalize()
+    STREAMABLE_FORMATS = ('markdown', 'html')
 
-    def to_html(self, pages_content: List[Dict[str, Any]], include_images: bool = True) -> str:
-        """
-        Convert OCR results to HTML format
-
-        Args:
-            pages_content: List of page dictionaries with text and metadata
-            include_images: Whether to include images
-
-        Returns:
-            HTML formatted string
-        """
-        html_parts = []
-
-        # HTML header
-        html_parts.append("""
+    _HTML_HEADER = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -134,39 +88,143 @@ class DocumentConverter:
 </head>
 <body>
     <h1>DeepSeek OCR Results</h1>
-""")
+"""
 
-        # Process each page
-        for idx, page in enumerate(pages_content):
-            html_parts.append(f'    <div class="page">')
-            html_parts.append(f'        <h2 class="page-header">Page {idx + 1}</h2>')
+    _HTML_FOOTER = """
+</body>
+</html>
+"""
 
-            text = page.get('text', '')
+    def __init__(self):
+        self.page_separator = '<--- Page Split --->'
+        self._stream_format = None
+        self._stream_include_images = True
+        self._stream_page_count = 0
 
-            # Handle images if present
-            if include_images and 'images' in page:
-                for img_idx, img_data in enumerate(page.get('images', [])):
-                    placeholder = f"[IMAGE_{img_idx}]"
-                    img_tag = f'<img src="data:image/jpeg;base64,{img_data}" alt="Image {img_idx + 1}" />'
-                    text = text.replace(placeholder, img_tag)
+    def to_markdown(self, pages_content: List[Dict[str, Any]], include_images: bool = True) -> str:
+        """
+        Convert OCR results to Markdown format
 
-            # Convert markdown to HTML if the text appears to be markdown
-            if self._is_markdown(text):
-                html_content = markdown.markdown(text, extensions=['tables', 'fenced_code'])
-            else:
-                # Otherwise, preserve the HTML or wrap in paragraph
-                html_content = text if '<' in text else f'<p>{text.replace(chr(10), "<br>")}</p>'
+        Args:
+            pages_content: List of page dictionaries with text and metadata
+            include_images: Whether to include image references
 
-            html_parts.append(f'        {html_content}')
-            html_parts.append('    </div>')
+        Returns:
+            Markdown formatted string
+        """
+        return self._convert_streamable('markdown', pages_content, include_images)
 
-        # HTML footer
-        html_parts.append("""
-</body>
-</html>
-""")
+    def to_html(self, pages_content: List[Dict[str, Any]], include_images: bool = True) -> str:
+        """
+        Convert OCR results to HTML format
+
+        Args:
+            pages_content: List of page dictionaries with text and metadata
+            include_images: Whether to include images
+
+        Returns:
+            HTML formatted string
+        """
+        return self._convert_streamable('html', pages_content, include_images)
 
-        return "\n".join(html_parts)
+    def begin(self, output_format: str, include_images: bool = True) -> str:
+        """
+        Start incremental conversion; feed pages in order with append_page()
+
+        Args:
+            output_format: One of STREAMABLE_FORMATS
+            include_images: Whether to include images
+
+        Returns:
+            Leading chunk of the document (may be empty)
+        """
+        if output_format not in self.STREAMABLE_FORMATS:
+            raise ValueError(f"Format does not support incremental conversion: {output_format}")
+
+        self._stream_format = output_format
+        self._stream_include_images = include_images
+        self._stream_page_count = 0
+        return self._HTML_HEADER if output_format == 'html' else ''
+
+    def append_page(self, page: Dict[str, Any]) -> str:
+        """
+        Convert the next page of an incremental conversion
+
+        Args:
+            page: Page dictionary with text and metadata
+
+        Returns:
+            Chunk to append to the document
+        """
+        idx = self._stream_page_count
+        self._stream_page_count += 1
+
+        if self._stream_format == 'markdown':
+            parts = self._markdown_page_parts(page, idx, self._stream_include_images)
+            # Pages are newline-joined, so only later pages need a leading newline
+            return ("\n" if idx else "") + "\n".join(parts)
+
+        parts = self._html_page_parts(page, idx, self._stream_include_images)
+        return "\n" + "\n".join(parts)
+
+    def finalize(self) -> str:
+        """
+        Finish incremental conversion
+
+        Returns:
+            Trailing chunk of the document (may be empty)
+        """
+        output_format = self._stream_format
+        self._stream_format = None
+        return "\n" + self._HTML_FOOTER if output_format == 'html' else ''
+
+    def _convert_streamable(self, output_format: str, pages_content: List[Dict[str, Any]],
+                            include_images: bool) -> str:
+        """Convert all pages at once through the incremental API"""
+        chunks = [self.begin(output_format, include_images)]
+        chunks.extend(self.append_page(page) for page in pages_content)
+        chunks.append(self.finalize())
+        return "".join(chunks)
+
+    def _markdown_page_parts(self, page: Dict[str, Any], idx: int, include_images: bool) -> List[str]:
+        """Markdown lines for one page (header, text, separator)"""
+        text = page.get('text', '')
+
+        # Process and clean the text
+        if include_images and 'images' in page:
+            # Replace image placeholders with actual markdown image syntax
+            for img_idx, img_data in enumerate(page.get('images', [])):
+                placeholder = f"[IMAGE_{img_idx}]"
+                img_ref = f"![Image {img_idx + 1}](data:image/jpeg;base64,{img_data})"
+                text = text.replace(placeholder, img_ref)
+
+        # Page header, text, page separator
+        return [f"# Page {idx + 1}\n", text, "\n\n---\n\n"]
+
+    def _html_page_parts(self, page: Dict[str, Any], idx: int, include_images: bool) -> List[str]:
+        """HTML lines for one page"""
+        text = page.get('text', '')
+
+        # Handle images if present
+        if include_images and 'images' in page:
+            for img_idx, img_data in enumerate(page.get('images', [])):
+                placeholder = f"[IMAGE_{img_idx}]"
+                img_tag = f'<img src="data:image/jpeg;base64,{img_data}" alt="Image {img_idx + 1}" />'
+                text = text.replace(placeholder, img_tag)
+
+        # Convert markdown to HTML if the text appears to be markdown
+        if self._is_markdown(text):
+            html_content = markdown.markdown(text, extensions=['tables', 'fenced_code'])
+        else:
+            # Otherwise, preserve the HTML or wrap in paragraph
+            html_content = text if '<' in text else f'<p>{text.replace(chr(10), "<br>")}</p>'
+
+        return [
+            f'    <div class="page">',
+            f'        <h2 class="page-header">Page {idx + 1}</h2>',
+            f'        {html_content}',
+            '    </div>',
+        ]
 
     def to_docx(self, pages_content: List[Dict[str, Any]], include_images: bool = True) -> BytesIO:
         """
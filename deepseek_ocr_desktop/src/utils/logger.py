@@ -174,7 +174,7 @@ def log_function_call(logger: logging.Logger):
 
 def log_pdf_page(logger: logging.Logger, page_num: int, total_pages: int, status: str = "processing"):
     """Log PDF page processing status"""
-    logger.info(f"PDF Page {page_num}/{total_pages} - {status}")
+    logger.info("PDF Page %d/%d - %s", page_num, total_pages, status)
 
 
 def log_ocr_result(logger: logging.Logger, text_length: int, has_boxes: bool = False):
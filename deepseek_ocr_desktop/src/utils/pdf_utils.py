@@ -5,59 +5,71 @@ Handles PDF to image conversion and batch processing
 
 import io
 import re
-from typing import List, Tuple, Dict, Any
+from typing import Iterator, List, Tuple, Dict, Any
 import fitz  # PyMuPDF
 import img2pdf
 from PIL import Image
 import numpy as np
 
 
-def pdf_to_images_high_quality(pdf_bytes: bytes, dpi: int = 144) -> List[Image.Image]:
+def pdf_page_count(pdf_bytes: bytes) -> int:
     """
-    Convert PDF pages to high-quality PIL images
+    Count the pages of a PDF without rendering them
 
     Args:
         pdf_bytes: PDF file as bytes
-        dpi: Resolution for rendering (default: 144)
 
     Returns:
-        List of PIL Image objects, one per page
+        Number of pages
     """
-    images = []
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as pdf_document:
+        return pdf_document.page_count
 
-    # Open PDF from bytes
-    pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
+
+def pdf_to_images_iter(pdf_bytes: bytes, dpi: int = 144) -> Iterator[Image.Image]:
+    """
+    Render PDF pages to high-quality PIL images one page at a time
+
+    Args:
+        pdf_bytes: PDF file as bytes
+        dpi: Resolution for rendering (default: 144)
+
+    Yields:
+        PIL Image objects, one per page, in page order
+    """
+    # Allow large images
+    Image.MAX_IMAGE_PIXELS = None
 
     # Calculate zoom factor from DPI
     zoom = dpi / 72.0
     matrix = fitz.Matrix(zoom, zoom)
 
-    # Process each page
-    for page_num in range(pdf_document.page_count):
-        page = pdf_document[page_num]
+    # Open PDF from bytes
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as pdf_document:
+        for page_num in range(pdf_document.page_count):
+            page = pdf_document.load_page(page_num)
 
-        # Render page to pixmap
-        pixmap = page.get_pixmap(matrix=matrix, alpha=False)
+            # Render straight to RGB; alpha=False composites onto white
+            pixmap = page.get_pixmap(matrix=matrix, alpha=False, colorspace=fitz.csRGB)
 
-        # Allow large images
-        Image.MAX_IMAGE_PIXELS = None
+            # Wrap the raw samples in a PIL Image (no PNG encode/decode)
+            yield Image.frombytes(
+                "RGB", (pixmap.width, pixmap.height), pixmap.samples, "raw", "RGB", pixmap.stride
+            )
 
-        # Convert to PIL Image
-        img_data = pixmap.tobytes("png")
-        img = Image.open(io.BytesIO(img_data))
 
-        # Ensure RGB mode
-        if img.mode in ('RGBA', 'LA'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
+def pdf_to_images_high_quality(pdf_bytes: bytes, dpi: int = 144) -> List[Image.Image]:
+    """
+    Convert PDF pages to high-quality PIL images
 
-        images.append(img)
+    Args:
+        pdf_bytes: PDF file as bytes
+        dpi: Resolution for rendering (default: 144)
 
-    pdf_document.close()
-    return images
+    Returns:
+        List of PIL Image objects, one per page
+    """
+    return list(pdf_to_images_iter(pdf_bytes, dpi=dpi))
 
 
 def images_to_pdf(pil_images: List[Image.Image]) -> bytes:
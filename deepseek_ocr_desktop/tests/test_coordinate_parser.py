@@ -0,0 +1,155 @@
+"""
+Tests for core.coordinate_parser
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PySide6")  # utils.logger
+
+from core import coordinate_parser
+from core.coordinate_parser import _INT_BOXES_RE, _parse_box_list, parse_detections
+
+
+def _det(coords: str, label: str = "text") -> str:
+    """Wrap a coords expression in a ref/det block"""
+    return f"<|ref|>{label}<|/ref|><|det|>{coords}<|/det|>"
+
+
+class TestParseBoxList:
+    def test_json_list_of_boxes(self):
+        assert _parse_box_list("[[1, 2, 3, 4], [5, 6, 7, 8]]") == [[1, 2, 3, 4], [5, 6, 7, 8]]
+
+    def test_json_flat_box(self):
+        assert _parse_box_list("[1.5, 2, 3, 4]") == [[1.5, 2, 3, 4]]
+
+    def test_literal_eval_fallback_on_trailing_comma(self):
+        # Not valid JSON, but a valid Python literal
+        assert _parse_box_list("[[1, 2, 3, 4],]") == [[1, 2, 3, 4]]
+
+    def test_literal_eval_fallback_on_tuples(self):
+        assert _parse_box_list("[(1, 2, 3, 4)]") == [(1, 2, 3, 4)]
+
+    def test_malformed_boxes_are_skipped_and_long_boxes_truncated(self):
+        assert _parse_box_list("[[1, 2, 3], [1, 2, 3, 4, 5], 7]") == [[1, 2, 3, 4]]
+
+    def test_unparseable_raises(self):
+        with pytest.raises((ValueError, SyntaxError)):
+            _parse_box_list("[[1, 2, 3, 4]")
+
+    def test_unsupported_structure_raises(self):
+        with pytest.raises(ValueError):
+            _parse_box_list('{"box": [1, 2, 3, 4]}')
+
+
+class TestParseDetections:
+    def test_no_detection_blocks(self):
+        assert parse_detections("plain text", 100, 100) == []
+        assert parse_detections("", 100, 100) == []
+
+    def test_non_json_coords_go_through_fallback(self):
+        boxes = parse_detections(_det("[[0, 0, 999, 999],]"), 200, 100)
+        assert boxes == [{"label": "text", "box": [0, 0, 200, 100]}]
+
+    def test_float_coords(self):
+        boxes = parse_detections(_det("[[499.5, 0, 999, 999.0]]"), 999, 999)
+        assert boxes == [{"label": "text", "box": [499, 0, 999, 999]}]
+
+    def test_unparseable_block_is_skipped(self):
+        assert parse_detections(_det("[[1, 2, 3, 4]"), 10, 10) == []
+
+
+class TestIntFastPath:
+    @pytest.mark.parametrize("coords", [
+        "[1, 2, 3, 4]",
+        "[[1, 2, 3, 4]]",
+        "[[1,2,3,4],[5, 6, 7, 8]]",
+        "[ [ 1 , 2 , 3 , 4 ] , [ 5 , 6 , 7 , 8 ] ]",
+    ])
+    def test_plain_integer_boxes_match(self, coords):
+        assert _INT_BOXES_RE.fullmatch(coords)
+
+    @pytest.mark.parametrize("coords", [
+        "[1.5, 2, 3, 4]",
+        "[[1, 2, 3]]",
+        "[[1, 2, 3, 4, 5]]",
+        "[[1, 2, 3, 4],]",
+        "[[-1, 2, 3, 4]]",
+        "[[[1, 2, 3, 4]]]",
+    ])
+    def test_other_shapes_use_the_list_parser(self, coords):
+        assert not _INT_BOXES_RE.fullmatch(coords)
+
+    @pytest.mark.parametrize("coords", [
+        "[0, 250, 999, 500]",
+        "[[0, 250, 999, 500]]",
+        "[[0, 250, 999, 500], [100, 200, 300, 400], [998, 1, 2, 997]]",
+    ])
+    def test_fast_path_matches_list_parser(self, coords, monkeypatch):
+        text = _det(coords, label="a") + "\ntrailing text"
+        fast = parse_detections(text, 1280, 720)
+
+        # Force the general parser by making the fast path never match
+        monkeypatch.setattr(coordinate_parser, "_INT_BOXES_RE", coordinate_parser.re.compile(r"(?!)"))
+        assert fast == parse_detections(text, 1280, 720)
+        assert len(fast) == len(_parse_box_list(coords))
+
+
+def _random_boxes(n: int, seed: int = 0):
+    """Integer and fractional 0-999 boxes, including both ends of the range"""
+    rng = np.random.default_rng(seed)
+    boxes = np.vstack([
+        rng.integers(0, 1000, size=(n, 4)).astype(np.float64),
+        rng.uniform(0, 999, size=(n, 4)),
+        [[0, 0, 999, 999], [1, 998, 500, 499.5]],
+    ])
+    return boxes
+
+
+class TestScaleBoxes:
+    @pytest.mark.parametrize("width, height", [(1280.0, 720.0), (999.0, 999.0), (1.0, 4096.0), (3517.0, 2231.0)])
+    def test_numpy_matches_scalar_formula(self, width, height):
+        boxes = _random_boxes(200)
+        expected = [
+            [int(x1 / 999 * width), int(y1 / 999 * height), int(x2 / 999 * width), int(y2 / 999 * height)]
+            for x1, y1, x2, y2 in boxes.tolist()
+        ]
+        assert coordinate_parser._scale_boxes_numpy(boxes, width, height).tolist() == expected
+
+    @pytest.mark.parametrize("width, height", [(1280.0, 720.0), (999.0, 999.0), (1.0, 4096.0), (3517.0, 2231.0)])
+    def test_numba_matches_numpy(self, width, height):
+        pytest.importorskip("numba")
+        kernel = coordinate_parser._jit_scale_boxes()
+        assert kernel is not None
+        boxes = _random_boxes(200, seed=1)
+        np.testing.assert_array_equal(
+            kernel(boxes, width, height),
+            coordinate_parser._scale_boxes_numpy(boxes, width, height),
+        )
+
+    def test_python_kernel_matches_numpy(self):
+        # The kernel source also runs as plain Python, so parity holds without Numba
+        boxes = _random_boxes(50, seed=2)
+        np.testing.assert_array_equal(
+            coordinate_parser._scale_boxes_kernel(boxes, 1920.0, 1080.0),
+            coordinate_parser._scale_boxes_numpy(boxes, 1920.0, 1080.0),
+        )
+
+    def test_failing_kernel_falls_back_to_numpy(self, monkeypatch):
+        def broken(arr, image_width, image_height):
+            raise RuntimeError("compile failed")
+
+        monkeypatch.setattr(coordinate_parser, "_scale_boxes_jit", broken)
+        boxes = _random_boxes(10, seed=3)
+        np.testing.assert_array_equal(
+            coordinate_parser._scale_boxes(boxes, 640.0, 480.0),
+            coordinate_parser._scale_boxes_numpy(boxes, 640.0, 480.0),
+        )
+        # Disabled for the rest of the process after the first failure
+        assert coordinate_parser._scale_boxes_jit is None
+
+    def test_parse_detections_without_numba(self, monkeypatch):
+        text = _det("[[0, 250, 999, 500], [100, 200, 300, 400]]")
+        expected = parse_detections(text, 1280, 720)
+        monkeypatch.setattr(coordinate_parser, "_scale_boxes_jit", None)
+        assert parse_detections(text, 1280, 720) == expected
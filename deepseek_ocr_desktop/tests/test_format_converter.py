@@ -0,0 +1,88 @@
+"""
+Tests for utils.format_converter incremental (begin/append_page/finalize) conversion
+"""
+
+import pytest
+
+pytest.importorskip("docx")
+pytest.importorskip("markdown")
+pytest.importorskip("PIL")
+
+from utils.format_converter import DocumentConverter
+
+PAGES = [
+    {"text": "First page\n\nwith two paragraphs"},
+    {"text": "# Heading\n\n| a | b |\n|---|---|\n| 1 | 2 |"},
+    {"text": "Figure: [IMAGE_0]", "images": ["QUJD"]},
+    {},
+]
+
+
+def _stream(converter: DocumentConverter, output_format: str, pages, include_images=True) -> str:
+    """Build a document chunk by chunk, as PDFWorker does"""
+    chunks = [converter.begin(output_format, include_images)]
+    chunks.extend(converter.append_page(page) for page in pages)
+    chunks.append(converter.finalize())
+    return "".join(chunks)
+
+
+def _joined_markdown(pages) -> str:
+    """Markdown as the whole-document converter built it: all parts newline-joined"""
+    parts = []
+    for idx, page in enumerate(pages):
+        text = page.get("text", "")
+        for img_idx, img_data in enumerate(page.get("images", [])):
+            text = text.replace(f"[IMAGE_{img_idx}]", f"![Image {img_idx + 1}](data:image/jpeg;base64,{img_data})")
+        parts.extend([f"# Page {idx + 1}\n", text, "\n\n---\n\n"])
+    return "\n".join(parts)
+
+
+@pytest.mark.parametrize("pages", [PAGES, PAGES[:1], []])
+def test_markdown_stream_matches_whole_document(pages):
+    converter = DocumentConverter()
+    streamed = _stream(converter, "markdown", pages)
+    assert streamed == converter.to_markdown(pages)
+    assert streamed == _joined_markdown(pages)
+
+
+def test_markdown_without_images_keeps_placeholders():
+    converter = DocumentConverter()
+    streamed = _stream(converter, "markdown", PAGES, include_images=False)
+    assert streamed == converter.to_markdown(PAGES, include_images=False)
+    assert "[IMAGE_0]" in streamed
+    assert "data:image/jpeg" not in streamed
+
+
+@pytest.mark.parametrize("pages", [PAGES, PAGES[:1], []])
+def test_html_stream_matches_whole_document(pages):
+    converter = DocumentConverter()
+    streamed = _stream(converter, "html", pages)
+    assert streamed == converter.to_html(pages)
+
+    # Whole-document layout: header, page blocks and footer, newline-joined
+    parts = [DocumentConverter._HTML_HEADER]
+    for idx, page in enumerate(pages):
+        parts.extend(converter._html_page_parts(page, idx, True))
+    parts.append(DocumentConverter._HTML_FOOTER)
+    assert streamed == "\n".join(parts)
+
+
+def test_html_page_content():
+    html = DocumentConverter().to_html(PAGES)
+    assert html.count('<div class="page">') == len(PAGES)
+    assert '<h2 class="page-header">Page 4</h2>' in html
+    assert "<table>" in html
+    assert '<img src="data:image/jpeg;base64,QUJD" alt="Image 1" />' in html
+    assert html.rstrip().endswith("</html>")
+
+
+def test_converter_is_reusable_after_finalize():
+    converter = DocumentConverter()
+    first = _stream(converter, "markdown", PAGES)
+    assert _stream(converter, "markdown", PAGES) == first
+    assert _stream(converter, "html", PAGES[:1]) == converter.to_html(PAGES[:1])
+
+
+def test_unstreamable_format_is_rejected():
+    with pytest.raises(ValueError):
+        DocumentConverter().begin("docx")
@@ -0,0 +1,31 @@
+"""
+Tests for core.ocr_processor.normalize_model_output
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("openai")
+pytest.importorskip("PIL")
+pytest.importorskip("PySide6")
+
+from core.ocr_processor import normalize_model_output
+
+
+@pytest.mark.parametrize("res, expected", [
+    ("  text \n", "text"),
+    ("", ""),
+    ({"text": " text "}, "text"),
+    ({"text": 42}, "42"),
+    ({"text": "a", "other": "b"}, "a"),
+    (["line 1", "line 2 "], "line 1\nline 2"),
+    (("line 1", 2), "line 1\n2"),
+    ([], ""),
+])
+def test_supported_shapes(res, expected):
+    assert normalize_model_output(res) == expected
+
+
+@pytest.mark.parametrize("res", [None, 42, {"content": "text"}, {}, b"text"])
+def test_unsupported_shapes_give_empty_text(res):
+    assert normalize_model_output(res) == ""
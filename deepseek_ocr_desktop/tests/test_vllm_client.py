@@ -0,0 +1,111 @@
+"""
+Tests for core.vllm_client: result cache and upload downscaling
+"""
+
+import base64
+import io
+import os
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("PySide6")  # utils.logger
+Image = pytest.importorskip("PIL.Image")
+
+from core import vllm_client
+from core.vllm_client import VLLMClient, _shrink_for_upload
+
+
+@pytest.fixture
+def client():
+    client = VLLMClient(endpoint="http://127.0.0.1:9/v1")
+    yield client
+    client.close()
+
+
+def _encode(size, fmt="PNG", noise=False) -> bytes:
+    """Encode an RGB image; noise defeats compression so the file stays large"""
+    if noise:
+        img = Image.frombytes("RGB", size, os.urandom(size[0] * size[1] * 3))
+    else:
+        img = Image.new("RGB", size, (255, 255, 255))
+    buffer = io.BytesIO()
+    img.save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def _uploaded(request):
+    """Decode the data URI of a built request into (MIME type, bytes)"""
+    url = request["messages"][0]["content"][0]["image_url"]["url"]
+    header, payload = url.split(",", 1)
+    return header[len("data:"):-len(";base64")], base64.b64decode(payload)
+
+
+class TestResultCache:
+    def test_miss_then_hit(self, client):
+        key = ("prompt", b"digest")
+        assert client._cached_result(key) is None
+        client._cache_result(key, "text")
+        assert client._cached_result(key) == "text"
+
+    def test_key_includes_prompt_and_image(self, client, tmp_path):
+        image_file = tmp_path / "page.png"
+        image_file.write_bytes(_encode((8, 8)))
+        _, mime_type, key = client._read_image("a", str(image_file), None, "image/jpeg")
+        _, _, same = client._read_image("a", None, image_file.read_bytes(), "image/png")
+        _, _, other_prompt = client._read_image("b", str(image_file), None, "image/jpeg")
+        _, _, other_image = client._read_image("a", None, _encode((9, 9)), "image/png")
+
+        assert mime_type == "image/png"
+        assert key == same
+        assert key != other_prompt
+        assert key != other_image
+
+    def test_evicts_least_recently_used(self, client, monkeypatch):
+        monkeypatch.setattr(VLLMClient, "_RESULT_CACHE_SIZE", 2)
+        client._cache_result(("p", b"1"), "one")
+        client._cache_result(("p", b"2"), "two")
+        # Touch the oldest entry so the second one becomes least recently used
+        assert client._cached_result(("p", b"1")) == "one"
+        client._cache_result(("p", b"3"), "three")
+
+        assert client._cached_result(("p", b"2")) is None
+        assert client._cached_result(("p", b"1")) == "one"
+        assert client._cached_result(("p", b"3")) == "three"
+
+    def test_size_is_bounded(self, client):
+        for n in range(VLLMClient._RESULT_CACHE_SIZE + 10):
+            client._cache_result(("p", n.to_bytes(2, "big")), str(n))
+        assert len(client._results) == VLLMClient._RESULT_CACHE_SIZE
+
+
+class TestShrinkForUpload:
+    def test_small_dimensions_are_left_alone(self):
+        side = vllm_client._UPLOAD_MAX_SIDE
+        assert _shrink_for_upload(_encode((side, side // 2))) is None
+
+    def test_large_dimensions_are_downscaled_to_jpeg(self):
+        side = vllm_client._UPLOAD_MAX_SIDE
+        shrunk = _shrink_for_upload(_encode((side * 2, side)))
+        with Image.open(io.BytesIO(shrunk)) as img:
+            assert img.format == "JPEG"
+            assert img.size == (side, side // 2)
+
+    def test_small_file_is_sent_untouched(self, client):
+        # Oversized dimensions, but below the re-encode byte threshold
+        data = _encode((vllm_client._UPLOAD_MAX_SIDE * 2, 100))
+        assert len(data) <= vllm_client._UPLOAD_REENCODE_MIN_BYTES
+        assert _uploaded(client._build_request("p", data, "image/png")) == ("image/png", data)
+
+    def test_large_file_within_max_side_is_sent_untouched(self, client):
+        data = _encode((600, 600), noise=True)
+        assert len(data) > vllm_client._UPLOAD_REENCODE_MIN_BYTES
+        assert _uploaded(client._build_request("p", data, "image/png")) == ("image/png", data)
+
+    def test_large_oversized_file_is_reencoded(self, client):
+        data = _encode((vllm_client._UPLOAD_MAX_SIDE + 100, 200), noise=True)
+        assert len(data) > vllm_client._UPLOAD_REENCODE_MIN_BYTES
+        mime_type, sent = _uploaded(client._build_request("p", data, "image/png"))
+        assert mime_type == "image/jpeg"
+        with Image.open(io.BytesIO(sent)) as img:
+            assert max(img.size) == vllm_client._UPLOAD_MAX_SIDE